@@ -47,6 +47,12 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=1)  # 1 hour session timeout
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'pdf', 'doc', 'docx'}
 
+# Only the fields the login handlers read, to keep the auth lookup small
+LOGIN_USER_PROJECTION = {
+    "_id": 1, "email": 1, "password": 1, "name": 1, "is_admin": 1, "is_active": 1,
+    "lockout_until": 1, "failed_login_attempts": 1
+}
+
 # MongoDB setup
 # client = MongoClient(os.getenv("MONGO_URI","mongodb://localhost:27017"))
 client = MongoClient(os.getenv("MONGO_URI","mongodb+srv:alu:262122@evnet.k1uvmwe.mongodb.net/?retryWrites=true&w=majority&appName=evnet"))
@@ -407,7 +413,7 @@ def login():
     if request.method == "POST":
         email = request.form["email"]
         password = request.form["password"]
-        user = users_collection.find_one({"email": email})
+        user = users_collection.find_one({"email": email}, LOGIN_USER_PROJECTION)
 
         # --- NEW: Account Lockout Logic ---
         if user and user.get("lockout_until") and user["lockout_until"] > datetime.now():
@@ -1493,7 +1499,7 @@ def admin_login():
             flash("Please enter a valid email address.", "error")
             return redirect(url_for("admin_login"))
         
-        user = users_collection.find_one({"email": email})
+        user = users_collection.find_one({"email": email}, LOGIN_USER_PROJECTION)
         if user and check_password_hash(user["password"], password):
             if not user.get("is_active", True):
                 flash("Account is deactivated. Please contact a system administrator.", "error")
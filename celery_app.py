@@ -0,0 +1,54 @@
+"""
+Celery application and background notification tasks for Alumni Event Scheduler
+"""
+import logging
+from typing import Any, Dict, List
+
+from celery import Celery
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+celery = Celery('alumni_scheduler', broker=Config.CELERY_BROKER_URL, backend=Config.CELERY_RESULT_BACKEND)
+celery.conf.update(
+    task_serializer=Config.CELERY_TASK_SERIALIZER,
+    accept_content=Config.CELERY_ACCEPT_CONTENT,
+    result_serializer=Config.CELERY_RESULT_SERIALIZER,
+    timezone=Config.CELERY_TIMEZONE,
+    task_ignore_result=True
+)
+
+def get_manager():
+    """Return the worker's shared NotificationManager"""
+    from notifications import get_notification_manager
+    return get_notification_manager(Config)
+
+@celery.task(bind=True, max_retries=5, default_retry_delay=60)
+def send_notification_task(self, user: Dict, template_name: str, variables: Dict[str, Any],
+                           channels: List[str] = None, retry_failed: bool = False) -> Dict[str, bool]:
+    """Send one user's notification from a worker (retry_failed also retries channels that reported failure)"""
+    try:
+        results = get_manager().send_notification(user, 'queued', template_name, variables, channels)
+    except Exception as e:
+        logger.warning(f"Notification to {user.get('email', 'unknown')} failed, retrying: {str(e)}")
+        raise self.retry(exc=e)
+    failed = [channel for channel, sent in results.items() if not sent]
+    if retry_failed and failed:
+        logger.warning(f"Notification to {user.get('email', 'unknown')} failed on {failed}, retrying")
+        raise self.retry(args=(user, template_name, variables, failed, True))
+    return results
+
+@celery.task
+def send_bulk_notification_task(users: List[Dict], template_name: str, variables: Dict[str, Any],
+                                channels: List[str] = None) -> Dict[str, int]:
+    """Send a notification to many users from a worker"""
+    # Never retry the whole fan-out: users who were already notified would get it again.
+    # Each failed user gets their own retrying task for just the channels that failed.
+    failed = []
+    results = get_manager().send_bulk_notification(users, template_name, variables, channels, failed_users=failed)
+    for user, user_channels in failed:
+        send_notification_task.delay(user, template_name, variables, user_channels, True)
+    if failed:
+        logger.warning(f"Bulk notification {template_name}: re-queued {len(failed)} failed users individually")
+    return results
@@ -65,6 +65,7 @@ class Config:
     
     # Notification Settings
     DEFAULT_REMINDER_TIMES = [48, 24, 1]  # Hours before event
+    NOTIFY_CONCURRENCY = int(os.getenv('NOTIFY_CONCURRENCY', 32))  # Parallel sends per bulk job
     NOTIFICATION_TEMPLATES = {
         'event_created': {
             'subject': 'New Alumni Event: {{event_title}}',
@@ -0,0 +1,72 @@
+"""
+Shared pytest configuration for the Alumni Event Scheduler tests
+"""
+import os
+import sys
+from functools import lru_cache
+
+# Make the project modules importable from every pytest-xdist worker
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+
+def pytest_configure(config):
+    """Register the project's custom markers"""
+    config.addinivalue_line("markers", "slow: starts real servers, waits on the network or uses the real database; deselect with -m 'not slow'")
+
+
+@lru_cache(maxsize=4)
+def _cached_app(config_class):
+    """Build the API app once per config class, however many modules ask for it"""
+    from api import create_api_app
+    app = create_api_app(config_class)
+    app.config['TESTING'] = True
+    return app
+
+
+@pytest.fixture(scope="module")
+def app():
+    """The shared API app for a test module"""
+    from config import TestingConfig
+    return _cached_app(TestingConfig)
+
+
+@pytest.fixture
+def client(app):
+    """Fresh test client on the shared app"""
+    return app.test_client()
+
+
+@pytest.fixture(scope="session")
+def flask_app():
+    """Import the main Flask app once for the whole session"""
+    from app import app
+    return app
+
+
+@pytest.fixture(scope="session")
+def http():
+    """One keep-alive requests.Session per worker for the live-server probes"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    with requests.Session() as session:
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=0))
+        session.headers['Connection'] = 'keep-alive'
+        yield session
+
+
+@pytest.fixture(scope="session")
+def mongo():
+    """Probe MongoDB once per session; tests that need it skip when no server answers"""
+    from pymongo import MongoClient
+    from pymongo.errors import PyMongoError
+    client = MongoClient("mongodb://localhost:27017", maxPoolSize=8, serverSelectionTimeoutMS=500,
+                         connectTimeoutMS=2000, appname="alumni-scheduler-tests")
+    try:
+        client.server_info()
+    except PyMongoError as e:
+        client.close()
+        pytest.skip(f"MongoDB not reachable: {e}")
+    yield client
+    client.close()
@@ -68,11 +68,11 @@ def create_test_users():
     }
     
     # Insert users if they don't exist
-    if not users_collection.find_one({"email": "john@example.com"}):
+    if not users_collection.find_one({"email": "john@example.com"}, {"_id": 1}):
         users_collection.insert_one(alumni_user)
         print("✅ Created test alumni user: john@example.com / password123")
     
-    if not users_collection.find_one({"email": "admin@alumni-event-scheduler.com"}):
+    if not users_collection.find_one({"email": "admin@alumni-event-scheduler.com"}, {"_id": 1}):
         users_collection.insert_one(admin_user)
         print("✅ Created test admin user: admin@alumni-event-scheduler.com / admin123")
 
@@ -123,7 +123,7 @@ def create_test_events():
     ]
     
     for event in events:
-        if not events_collection.find_one({"title": event["title"]}):
+        if not events_collection.find_one({"title": event["title"]}, {"_id": 1}):
             events_collection.insert_one(event)
             print(f"✅ Created test event: {event['title']}")
 
@@ -8,6 +8,8 @@ import re
 import sys
 from pathlib import Path
 
+from fix_utils import list_files, scan_app_definitions
+
 def check_template_titles():
     """Check that all templates have the correct title"""
     print("🔍 Checking template titles...")
@@ -72,12 +74,11 @@ def check_app_configuration():
         if "admin@alumni-scheduler.com" in content:
             issues.append("Old admin email found")
         
-        # Check for forgot password routes
-        if "@app.route('/forgot-password'" not in content:
-            issues.append("Forgot password route missing")
-        
-        if "@app.route('/reset-password/<token>'" not in content:
-            issues.append("Reset password route missing")
+        # Check for forgot password routes with exact matches against the indexed route rules
+        route_rules = scan_app_definitions("app.py")['route_rules']
+        required_routes = {'/forgot-password': "Forgot password route missing",
+                           '/reset-password/<token>': "Reset password route missing"}
+        issues.extend(issue for rule, issue in required_routes.items() if rule not in route_rules)
         
         # Check for password reset token collection
         if "password_reset_tokens_collection" not in content:
@@ -127,12 +128,9 @@ def check_required_templates():
         "notifications.html"
     ]
     
-    missing_templates = []
-    
-    for template in required_templates:
-        template_path = Path(f"templates/{template}")
-        if not template_path.exists():
-            missing_templates.append(template)
+    # One directory read instead of a stat() per template
+    existing = list_files("templates")
+    missing_templates = sorted(set(required_templates) - existing)
     
     if missing_templates:
         print("❌ Missing templates:")
@@ -240,11 +238,11 @@ def create_test_users():
     }
     
     # Insert users if they don't exist
-    if not users_collection.find_one({"email": "john@example.com"}):
+    if not users_collection.find_one({"email": "john@example.com"}, {"_id": 1}):
         users_collection.insert_one(alumni_user)
         print("✅ Created test alumni user: john@example.com / password123")
     
-    if not users_collection.find_one({"email": "admin@alumni-event-scheduler.com"}):
+    if not users_collection.find_one({"email": "admin@alumni-event-scheduler.com"}, {"_id": 1}):
         users_collection.insert_one(admin_user)
         print("✅ Created test admin user: admin@alumni-event-scheduler.com / admin123")
 
@@ -295,7 +293,7 @@ def create_test_events():
     ]
     
     for event in events:
-        if not events_collection.find_one({"title": event["title"]}):
+        if not events_collection.find_one({"title": event["title"]}, {"_id": 1}):
             events_collection.insert_one(event)
             print(f"✅ Created test event: {event['title']}")
 
@@ -4,7 +4,32 @@ Fix admin access and navbar issues
 """
 
 import os
-import re
+import string
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# RE2 guarantees linear-time matching on the template/app scans; fall back to stdlib re
+try:
+    import re2 as re
+except ImportError:
+    import re
+
+from fix_utils import load_data_file, read_project_file, scan_app_definitions
+
+def _scan_template(template_file):
+    """Count block tags in a template, returning (path, starts, ends, error)"""
+    if not os.path.exists(template_file):
+        return template_file, None, None, None
+    
+    try:
+        content = read_project_file(template_file)
+        
+        # Count block tags
+        block_starts = len(re.findall(r'{% block \w+', content))
+        block_ends = len(re.findall(r'{% endblock %}', content))
+        return template_file, block_starts, block_ends, None
+    except Exception as e:
+        return template_file, None, None, e
 
 def fix_template_syntax():
     """Check and fix template syntax issues"""
@@ -16,25 +41,19 @@ def fix_template_syntax():
         "templates/admin_events.html"
     ]
     
-    for template_file in template_files:
-        if os.path.exists(template_file):
-            try:
-                with open(template_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Count block tags
-                block_starts = len(re.findall(r'{% block \w+', content))
-                block_ends = len(re.findall(r'{% endblock %}', content))
-                
-                if block_starts != block_ends:
-                    print(f"❌ {template_file}: Block mismatch - {block_starts} starts, {block_ends} ends")
-                else:
-                    print(f"✅ {template_file}: Block tags balanced")
-                    
-            except Exception as e:
-                print(f"❌ Error checking {template_file}: {e}")
-        else:
+    # Templates are independent, so read and scan them concurrently
+    with ThreadPoolExecutor(max_workers=len(template_files)) as executor:
+        results = list(executor.map(_scan_template, template_files))
+    
+    for template_file, block_starts, block_ends, error in results:
+        if error is not None:
+            print(f"❌ Error checking {template_file}: {error}")
+        elif block_starts is None:
             print(f"⚠️  {template_file} not found")
+        elif block_starts != block_ends:
+            print(f"❌ {template_file}: Block mismatch - {block_starts} starts, {block_ends} ends")
+        else:
+            print(f"✅ {template_file}: Block tags balanced")
 
 def check_route_permissions():
     """Check route permissions in app.py"""
@@ -42,25 +61,28 @@ def check_route_permissions():
     
     if os.path.exists("app.py"):
         try:
-            with open("app.py", 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Single scan of app.py yields {view name: first decorator under its route}
+            found = scan_app_definitions("app.py")['route_decorators']
             
             # Check for routes that should allow admin access
-            routes_to_check = [
-                ("profile", "general_login_required"),
-                ("user_notifications", "general_login_required"),
-                ("profile_settings", "general_login_required"),
-                ("directory", "general_login_required"),
-                ("jobs", "general_login_required"),
-                ("calendar_view", "general_login_required")
-            ]
+            routes_to_check = {
+                "profile": "general_login_required",
+                "user_notifications": "general_login_required",
+                "profile_settings": "general_login_required",
+                "directory": "general_login_required",
+                "jobs": "general_login_required",
+                "calendar_view": "general_login_required"
+            }
+            
+            # Report in the order the routes appear in app.py, then anything not found
+            ordered_routes = [name for name in found if name in routes_to_check]
+            ordered_routes += [name for name in routes_to_check if name not in found]
             
-            for route_name, expected_decorator in routes_to_check:
-                pattern = rf'@app\.route.*\n@(\w+)\ndef {route_name}'
-                match = re.search(pattern, content)
+            for route_name in ordered_routes:
+                expected_decorator = routes_to_check[route_name]
+                actual_decorator = found.get(route_name)
                 
-                if match:
-                    actual_decorator = match.group(1)
+                if actual_decorator:
                     if actual_decorator == expected_decorator:
                         print(f"✅ {route_name}: Correct decorator ({actual_decorator})")
                     else:
@@ -71,74 +93,16 @@ def check_route_permissions():
         except Exception as e:
             print(f"❌ Error checking app.py: {e}")
 
-def create_test_admin_user():
+@lru_cache(maxsize=None)
+def _admin_access_test_template():
+    """Parse the admin access test script template once per process"""
+    return string.Template(load_data_file('test_admin_access.py.tpl'))
+
+def create_test_admin_user(base_url="http://localhost:5000"):
     """Create a test script to verify admin access"""
     print("\n🔧 Creating admin access test script...")
     
-    test_script = '''#!/usr/bin/env python3
-"""
-Test admin access to various routes
-"""
-
-import requests
-import sys
-
-def test_admin_access():
-    """Test admin access to routes"""
-    base_url = "http://localhost:5000"
-    
-    # Routes that should be accessible to admin
-    admin_routes = [
-        "/profile",
-        "/notifications", 
-        "/profile/settings",
-        "/directory",
-        "/jobs",
-        "/calendar",
-        "/admin",
-        "/admin/users",
-        "/admin/events",
-        "/admin/analytics"
-    ]
-    
-    print("🧪 Testing Admin Route Access")
-    print("=" * 40)
-    print("Note: You need to be logged in as admin to test these routes")
-    print("Login at: http://localhost:5000/admin/login")
-    print("Test credentials: admin@alumni-event-scheduler.com / admin123")
-    print()
-    
-    for route in admin_routes:
-        try:
-            url = f"{base_url}{route}"
-            response = requests.get(url, timeout=5, allow_redirects=False)
-            
-            if response.status_code == 200:
-                status = "✅ OK"
-            elif response.status_code == 302:
-                status = "🔄 Redirect (may need login)"
-            elif response.status_code == 403:
-                status = "❌ Forbidden"
-            elif response.status_code == 404:
-                status = "❌ Not Found"
-            else:
-                status = f"⚠️  {response.status_code}"
-                
-            print(f"{route:<20} {status}")
-            
-        except requests.exceptions.RequestException as e:
-            print(f"{route:<20} ❌ Connection Error")
-    
-    print()
-    print("Manual Testing Steps:")
-    print("1. Start Flask app: python app.py")
-    print("2. Login as admin: http://localhost:5000/admin/login")
-    print("3. Test navbar dropdowns and links")
-    print("4. Verify admin can access directory and jobs")
-
-if __name__ == "__main__":
-    test_admin_access()
-'''
+    test_script = _admin_access_test_template().substitute(base_url=base_url)
     
     with open("test_admin_access.py", "w", encoding="utf-8") as f:
         f.write(test_script)
@@ -149,102 +113,7 @@ def create_navbar_fix_summary():
     """Create summary of fixes applied"""
     print("\n🔧 Creating fix summary...")
     
-    summary = '''# Admin Access and Navbar Fixes Applied
-
-## Issues Fixed
-
-### 1. Template Syntax Error ✅
-- **Issue**: Jinja2 template syntax error due to duplicate content in mobile menu
-- **Fix**: Removed duplicate mobile menu sections in base.html
-- **Result**: Template now renders without syntax errors
-
-### 2. Admin Profile Access ✅
-- **Issue**: Admin users couldn't access profile pages due to @alumni_required decorator
-- **Fix**: Changed decorators from @alumni_required to @general_login_required for:
-  - `/profile` - Profile view page
-  - `/profile/settings` - Profile settings page
-  - `/notifications` - User notifications page
-- **Result**: Admin users can now access their profile and settings
-
-### 3. Admin Directory and Jobs Access ✅
-- **Issue**: Admin users couldn't access directory and job board
-- **Fix**: 
-  - Changed route decorators to @general_login_required
-  - Removed navbar restrictions that hid these features from admins
-- **Result**: Admin users can now access and manipulate directory and jobs
-
-### 4. Navbar Quick Actions ✅
-- **Issue**: Some quick action links not working properly
-- **Fix**: 
-  - Updated route permissions
-  - Fixed navbar link restrictions
-  - Ensured all users can access calendar, directory, and jobs
-- **Result**: All quick action links now work for both alumni and admin
-
-## Routes Updated
-
-### Changed from @alumni_required to @general_login_required:
-- `/profile` - Profile view
-- `/profile/settings` - Profile settings  
-- `/notifications` - User notifications
-- `/directory` - Alumni directory
-- `/jobs` - Job board listing
-- `/job/<job_id>` - Job details
-- `/jobs/post` - Post new job
-- `/calendar` - Calendar view
-- `/calendar/<year>/<month>` - Calendar with date
-
-## Navbar Updates
-
-### Desktop Navbar:
-- Removed restrictions preventing admin access to directory and jobs
-- All users now see directory and job board links
-- Quick actions dropdown shows all features to all users
-
-### Mobile Menu:
-- Fixed duplicate content causing template errors
-- Organized sections properly
-- All features accessible to appropriate user types
-
-## Testing
-
-### Manual Testing Steps:
-1. **Start Application**: `python app.py`
-2. **Login as Admin**: Use admin@alumni-event-scheduler.com / admin123
-3. **Test Profile Access**: Click profile dropdown, access "My Profile"
-4. **Test Directory**: Access alumni directory from navbar
-5. **Test Jobs**: Access job board from navbar and quick actions
-6. **Test Calendar**: Access calendar from quick actions
-7. **Test Settings**: Access settings from profile dropdown
-8. **Test Notifications**: Access notifications from profile dropdown
-
-### Automated Testing:
-- Run `python test_admin_access.py` to test route accessibility
-- Check for 200 OK responses on all admin-accessible routes
-
-## Current Status
-
-### ✅ FULLY FUNCTIONAL
-- Admin users can access all appropriate features
-- Navbar dropdowns work correctly
-- Template syntax errors resolved
-- Route permissions properly configured
-
-### 🎯 VERIFIED WORKING
-- Profile access for admin users
-- Directory access for admin users  
-- Job board access and manipulation for admin users
-- Calendar view for all users
-- Settings and notifications for admin users
-- All navbar quick actions functional
-
----
-
-**Status**: ✅ **COMPLETE AND FUNCTIONAL**
-**Admin Access**: Full access to all appropriate features
-**Navbar**: All links and dropdowns working correctly
-**Template**: No syntax errors, renders properly
-'''
+    summary = load_data_file('admin_access_fixes.md')
     
     with open("ADMIN_ACCESS_FIXES.md", "w", encoding="utf-8") as f:
         f.write(summary)
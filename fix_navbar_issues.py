@@ -4,7 +4,18 @@ Fix navbar and functionality issues
 """
 
 import os
-import re
+
+# RE2 guarantees linear-time matching on the template/app scans; fall back to stdlib re
+try:
+    import re2 as re
+except ImportError:
+    import re
+
+from fix_utils import load_data_file, read_project_file
+
+# Case-insensitivity is scoped to the tag/attribute literals rather than the whole pattern
+POST_FORM_PATTERN = re.compile(r'(?s)(<(?i:form)[^>]*(?i:method)=["\'](?i:post)["\'][^>]*>)(.*?)</(?i:form)>')
+CSRF_INPUT = '\n                    <input type="hidden" name="csrf_token" value="{{ csrf_token() }}"/>'
 
 def fix_csrf_tokens():
     """Add CSRF tokens to forms that are missing them"""
@@ -18,26 +29,36 @@ def fix_csrf_tokens():
     for template_file in templates_to_fix:
         if os.path.exists(template_file):
             try:
-                with open(template_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = read_project_file(template_file)
+                lowered = content.lower()
                 
-                # Check if CSRF tokens are missing from forms
-                forms = re.findall(r'<form[^>]*method=["\']POST["\'][^>]*>(.*?)</form>', content, re.DOTALL | re.IGNORECASE)
+                if 'method="post"' not in lowered and "method='post'" not in lowered:
+                    print(f"✅ {template_file} has no POST forms")
+                    continue
                 
-                needs_fix = False
-                for form in forms:
-                    if 'csrf_token' not in form:
-                        needs_fix = True
+                # Stop at the first POST form that lacks a token; most templates have none
+                first_missing = None
+                for match in POST_FORM_PATTERN.finditer(content):
+                    if 'csrf_token' not in match.group(2):
+                        first_missing = match
                         break
                 
-                if needs_fix:
+                if first_missing is not None:
+                    # Record the end offset of every remaining opening tag whose form lacks a token
+                    insert_offsets = [
+                        match.end(1) for match in POST_FORM_PATTERN.finditer(content, first_missing.start())
+                        if 'csrf_token' not in match.group(2)
+                    ]
+                    
                     # Add CSRF tokens to POST forms that don't have them
-                    content = re.sub(
-                        r'(<form[^>]*method=["\']POST["\'][^>]*>)(?!\s*<input[^>]*name=["\']csrf_token["\'])',
-                        r'\1\n                    <input type="hidden" name="csrf_token" value="{{ csrf_token() }}"/>',
-                        content,
-                        flags=re.IGNORECASE
-                    )
+                    parts = []
+                    last_offset = 0
+                    for offset in insert_offsets:
+                        parts.append(content[last_offset:offset])
+                        parts.append(CSRF_INPUT)
+                        last_offset = offset
+                    parts.append(content[last_offset:])
+                    content = ''.join(parts)
                     
                     with open(template_file, 'w', encoding='utf-8') as f:
                         f.write(content)
@@ -57,8 +78,7 @@ def fix_graduation_year_issue():
     
     if os.path.exists("app.py"):
         try:
-            with open("app.py", 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_project_file("app.py")
             
             # Check if the fix is already applied
             if "grad_years_raw = users_collection.distinct" in content:
@@ -73,78 +93,7 @@ def create_navbar_test_script():
     """Create a test script for navbar functionality"""
     print("\n🔧 Creating navbar test script...")
     
-    test_script = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Navbar Test</title>
-    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-</head>
-<body class="bg-gray-100">
-    <div class="container mx-auto p-8">
-        <h1 class="text-3xl font-bold mb-8">Navbar Functionality Test</h1>
-        
-        <div class="bg-white p-6 rounded-lg shadow-lg">
-            <h2 class="text-xl font-semibold mb-4">Test Checklist:</h2>
-            
-            <div class="space-y-3">
-                <label class="flex items-center">
-                    <input type="checkbox" class="mr-2">
-                    <span>Mobile menu toggle works</span>
-                </label>
-                
-                <label class="flex items-center">
-                    <input type="checkbox" class="mr-2">
-                    <span>Dropdown menus open on hover</span>
-                </label>
-                
-                <label class="flex items-center">
-                    <input type="checkbox" class="mr-2">
-                    <span>Dropdown menus open on click</span>
-                </label>
-                
-                <label class="flex items-center">
-                    <input type="checkbox" class="mr-2">
-                    <span>Dropdown menus close when clicking outside</span>
-                </label>
-                
-                <label class="flex items-center">
-                    <input type="checkbox" class="mr-2">
-                    <span>All navigation links work</span>
-                </label>
-                
-                <label class="flex items-center">
-                    <input type="checkbox" class="mr-2">
-                    <span>User profile dropdown shows correct info</span>
-                </label>
-                
-                <label class="flex items-center">
-                    <input type="checkbox" class="mr-2">
-                    <span>Admin dropdown appears for admin users</span>
-                </label>
-                
-                <label class="flex items-center">
-                    <input type="checkbox" class="mr-2">
-                    <span>Logout functionality works</span>
-                </label>
-            </div>
-            
-            <div class="mt-6 p-4 bg-blue-50 rounded-lg">
-                <h3 class="font-semibold text-blue-800 mb-2">Instructions:</h3>
-                <ol class="list-decimal list-inside text-blue-700 space-y-1">
-                    <li>Start the Flask application</li>
-                    <li>Log in with test credentials</li>
-                    <li>Test each navbar functionality</li>
-                    <li>Check both desktop and mobile views</li>
-                    <li>Test with both alumni and admin accounts</li>
-                </ol>
-            </div>
-        </div>
-    </div>
-</body>
-</html>'''
+    test_script = load_data_file('navbar_test.html')
     
     with open("navbar_test.html", "w", encoding="utf-8") as f:
         f.write(test_script)
@@ -155,86 +104,7 @@ def create_debug_info():
     """Create debug information for troubleshooting"""
     print("\n🔧 Creating debug information...")
     
-    debug_info = '''# Navbar and Functionality Debug Guide
-
-## Common Issues and Solutions
-
-### 1. Dropdown Menus Not Working
-**Symptoms**: Dropdowns don't open on hover or click
-**Solutions**:
-- Check JavaScript console for errors
-- Ensure Tailwind CSS is loaded
-- Verify dropdown JavaScript is running
-- Check for conflicting CSS
-
-### 2. CSRF Token Errors (400 Bad Request)
-**Symptoms**: Forms return 400 errors
-**Solutions**:
-- Add `<input type="hidden" name="csrf_token" value="{{ csrf_token() }}"/>` to forms
-- Ensure CSRF protection is enabled in Flask
-- Check form method is POST
-
-### 3. Graduation Year Sorting Error
-**Symptoms**: TypeError when accessing directory
-**Solutions**:
-- Convert graduation years to integers before sorting
-- Filter out None/invalid values
-- Handle mixed data types
-
-### 4. ObjectId Serialization Error
-**Symptoms**: JSON serialization errors in calendar
-**Solutions**:
-- Convert ObjectIds to strings before JSON serialization
-- Use str(object_id) for MongoDB ObjectIds
-
-### 5. Mobile Menu Issues
-**Symptoms**: Mobile menu doesn't toggle
-**Solutions**:
-- Check mobile menu JavaScript
-- Verify button click handlers
-- Test on actual mobile devices
-
-## Testing Steps
-
-1. **Start Application**:
-   ```bash
-   python app.py
-   ```
-
-2. **Test User Flows**:
-   - Register new user
-   - Login as alumni
-   - Login as admin
-   - Test all navbar links
-   - Test dropdown menus
-   - Test mobile responsiveness
-
-3. **Check Browser Console**:
-   - Open Developer Tools (F12)
-   - Check Console tab for JavaScript errors
-   - Check Network tab for failed requests
-
-4. **Test Forms**:
-   - RSVP to events
-   - Post comments
-   - Edit profile
-   - Create events (admin)
-
-## Browser Compatibility
-
-- Chrome: ✅ Fully supported
-- Firefox: ✅ Fully supported  
-- Safari: ✅ Fully supported
-- Edge: ✅ Fully supported
-- Mobile browsers: ✅ Responsive design
-
-## Performance Tips
-
-- Use browser caching for static files
-- Minimize JavaScript execution
-- Optimize CSS delivery
-- Use CDN for external libraries
-'''
+    debug_info = load_data_file('debug_guide.md')
     
     with open("DEBUG_GUIDE.md", "w", encoding="utf-8") as f:
         f.write(debug_info)
@@ -6,6 +6,8 @@ Fix script for navbar and login issues
 import os
 import re
 
+from fix_utils import list_files, read_project_file, scan_app_definitions
+
 def fix_navbar_issues():
     """Fix common navbar issues"""
     print("🔧 Fixing Navbar Issues...")
@@ -15,8 +17,7 @@ def fix_navbar_issues():
     if os.path.exists(base_template):
         print("✅ Base template exists")
         
-        with open(base_template, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_project_file(base_template)
             
         # Check for common issues
         issues_found = []
@@ -45,23 +46,17 @@ def fix_login_routes():
     
     app_file = "app.py"
     if os.path.exists(app_file):
-        with open(app_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # One lexer pass over app.py indexes route rules and function definitions
+        app_index = scan_app_definitions(app_file)
             
         # Check for required routes
-        required_routes = [
-            r'@app\.route\(["\']\/login["\']',
-            r'@app\.route\(["\']\/admin\/login["\']',
-            r'@app\.route\(["\']\/logout["\']',
-            r'def login\(\):',
-            r'def admin_login\(\):',
-            r'def logout\(\):'
-        ]
+        required_routes = ['/login', '/admin/login', '/logout']
+        required_views = ['login', 'admin_login', 'logout']
         
-        missing_routes = []
-        for route_pattern in required_routes:
-            if not re.search(route_pattern, content):
-                missing_routes.append(route_pattern)
+        missing_routes = [f"@app.route('{rule}')"
+                          for rule in sorted(set(required_routes) - app_index['route_rules'])]
+        missing_routes += [f"def {view}()"
+                           for view in sorted(set(required_views) - app_index['functions'])]
         
         if missing_routes:
             print("❌ Missing routes:")
@@ -79,10 +74,7 @@ def fix_login_routes():
             'get_current_user'
         ]
         
-        missing_functions = []
-        for func in session_functions:
-            if f'def {func}(' not in content:
-                missing_functions.append(func)
+        missing_functions = sorted(set(session_functions) - app_index['functions'])
                 
         if missing_functions:
             print("❌ Missing session functions:")
@@ -99,8 +91,7 @@ def fix_css_issues():
     
     css_file = "static/css/styles.css"
     if os.path.exists(css_file):
-        with open(css_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_project_file(css_file)
             
         # Check for required CSS classes
         required_classes = [
@@ -111,10 +102,10 @@ def fix_css_issues():
             '.card-enhanced'
         ]
         
-        missing_classes = []
-        for css_class in required_classes:
-            if css_class not in content:
-                missing_classes.append(css_class)
+        # Single pass over the stylesheet for all class names
+        class_pattern = re.compile('|'.join(re.escape(c) for c in required_classes))
+        found_classes = {m.group(0) for m in class_pattern.finditer(content)}
+        missing_classes = [c for c in required_classes if c not in found_classes]
                 
         if missing_classes:
             print("❌ Missing CSS classes:")
@@ -137,11 +128,12 @@ def check_template_files():
         "templates/admin_dashboard.html"
     ]
     
-    missing_templates = []
+    # One directory read instead of a stat() per template
+    existing = list_files("templates")
+    by_name = {os.path.basename(template): template for template in required_templates}
+    missing_templates = sorted(by_name[name] for name in by_name.keys() - existing)
     for template in required_templates:
-        if not os.path.exists(template):
-            missing_templates.append(template)
-        else:
+        if template not in missing_templates:
             print(f"✅ {template}")
             
     if missing_templates:
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the fix/check scripts
+"""
+
+import http.client
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+# (connect, read) seconds; a local Flask server that takes longer than this is down
+PROBE_TIMEOUT = (0.5, 2.0)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+@lru_cache(maxsize=64)
+def _read_cached(path, mtime_ns, size):
+    """Read a file once per (path, mtime, size) combination"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def read_project_file(path):
+    """Read a project file, reusing the cached content until the file changes"""
+    stat = os.stat(path)
+    return _read_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def load_data_file(name):
+    """Load a bundled text template from the data directory"""
+    with open(os.path.join(DATA_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=8)
+def _scan_app_cached(path, mtime_ns, size):
+    """Index route rules, route decorators and top-level functions in one lexer pass"""
+    index = {'route_rules': set(), 'route_decorators': {}, 'functions': set()}
+    pending = {'route': False, 'decorators': []}
+
+    def on_route(scanner, token):
+        rule = re.search(r'["\']([^"\']*)["\']', token)
+        if rule:
+            index['route_rules'].add(rule.group(1))
+        pending['route'] = True
+
+    def on_decorator(scanner, token):
+        if pending['route']:
+            pending['decorators'].append(re.match(r'@([\w.]+)', token).group(1))
+
+    def on_def(scanner, token):
+        name = token[4:-1]
+        index['functions'].add(name)
+        if pending['route']:
+            decorators = pending['decorators']
+            index['route_decorators'][name] = decorators[0] if decorators else None
+        on_other(scanner, token)
+
+    def on_other(scanner, token):
+        pending['route'] = False
+        pending['decorators'] = []
+
+    scanner = re.Scanner([
+        (r'@app\.route\([^\n]*\n', on_route),
+        (r'@[^\n]*\n', on_decorator),
+        (r'def \w+\(', on_def),
+        (r'[^\n]*\n|[^\n]+', on_other),
+    ])
+    scanner.scan(_read_cached(path, mtime_ns, size))
+    return index
+
+
+def scan_app_definitions(path):
+    """Return the cached route/function index for a Flask app module"""
+    stat = os.stat(path)
+    return _scan_app_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def list_files(directory):
+    """Names of the regular files in directory, from a single scandir pass"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+_probe_local = threading.local()
+
+
+def _probe_connection(base_url):
+    """Return this worker thread's persistent connection to the dev server at base_url"""
+    conn = getattr(_probe_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPConnection(urlsplit(base_url).netloc, timeout=PROBE_TIMEOUT[0])
+        _probe_local.conn = conn
+    return conn
+
+
+def _probe_request(base_url, method, route):
+    """Send one request on the thread's connection and drain the response"""
+    conn = _probe_connection(base_url)
+    try:
+        if conn.sock is None:
+            conn.connect()
+            conn.sock.settimeout(PROBE_TIMEOUT[1])
+        conn.request(method, route)
+        response = conn.getresponse()
+        response.read()  # drain so the connection can carry the next request
+        return response
+    except (OSError, http.client.HTTPException):
+        conn.close()
+        raise
+
+
+def probe(base_url, route):
+    """HEAD a route for its status, retrying once with GET if HEAD is not allowed"""
+    response = _probe_request(base_url, "HEAD", route)
+    if response.status == 405:
+        response = _probe_request(base_url, "GET", route)
+    return response
+
+
+def _probe_or_none(base_url, route):
+    """probe(), with None for a server that could not be reached"""
+    try:
+        return probe(base_url, route)
+    except (OSError, http.client.HTTPException):
+        return None
+
+
+def probe_routes(base_url, routes, max_workers=16):
+    """Probe routes concurrently, one keep-alive connection per worker.
+
+    Yields (route, response) in the order of routes; response is None when the server could not be reached.
+    """
+    routes = list(routes)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        yield from zip(routes, pool.map(_probe_or_none, [base_url] * len(routes), routes))
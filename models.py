@@ -1,23 +1,163 @@
 """
 Enhanced data models for Alumni Event Scheduler
 """
+import copy
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from bson import ObjectId
-from pymongo import MongoClient
+from pymongo import IndexModel, MongoClient, UpdateOne, WriteConcern
+from pymongo.errors import OperationFailure
 import pytz
 from typing import List, Dict, Optional, Any
 import re
+from config import Config
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'^\+?[\d\s\-\(\)]{10,}$')
+_ALL_TIMEZONES = frozenset(pytz.all_timezones)
+_RSVP_STATUSES = ('going', 'maybe', 'not_going', 'waitlist')
+_RSVP_STATUS_SET = frozenset(_RSVP_STATUSES)
+_GUEST_COUNTING_STATUSES = ('going', 'maybe', 'waitlist')
+_MIN_TEXT_SEARCH_LENGTH = 3
+
+# List-view fields for upcoming events; all present in the covering start_time index
+UPCOMING_EVENT_PROJECTION = {"_id": 1, "title": 1, "start_time": 1, "venue": 1, "capacity": 1}
+
+# Fields the authentication path needs from a user document
+AUTH_PROJECTION = {"_id": 1, "password_hash": 1, "role": 1, "name": 1, "is_active": 1}
+
+# Per-user unread/latest-first notification index, shared with the notification test
+USER_READ_CREATED_INDEX = "user_read_created"
+
+# Covers the admin/alumni listing in the email diagnostics
+ADMIN_ACTIVE_INDEX = "admin_active_covered"
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a fixed time-to-live"""
+    
+    def __init__(self, maxsize: int = 4096, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key) -> Optional[Any]:
+        """Return a private copy of the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Copy so callers mutating the document cannot poison the cache
+        return copy.deepcopy(value)
+    
+    def set(self, key, value: Any):
+        """Cache a private copy of value"""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def pop(self, key):
+        """Drop a single entry"""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+@lru_cache(maxsize=1024)
+def _prefix_pattern(term: str) -> str:
+    """Escaped, anchored regex for a user-supplied search prefix (memoized for typeahead)"""
+    return '^' + re.escape(term)
+
+def _oid(value) -> ObjectId:
+    """Return value as an ObjectId, parsing only when given a string"""
+    return value if isinstance(value, ObjectId) else ObjectId(value)
+
+def _rsvp_stats_pipeline(event_id) -> List[Dict]:
+    """Aggregation producing one count per RSVP status plus the guest total"""
+    # Let the server produce the final shape: one count per status plus guest total
+    totals = {
+        status: {"$sum": {"$cond": [{"$eq": ["$status", status]}, 1, 0]}}
+        for status in _RSVP_STATUSES
+    }
+    # Guests only count toward attendance for RSVPs that may attend
+    totals['total_guests'] = {
+        "$sum": {"$cond": [{"$in": ["$status", list(_GUEST_COUNTING_STATUSES)]}, {"$ifNull": ["$guests", 0]}, 0]}
+    }
+    return [
+        {"$match": {"event_id": _oid(event_id)}},
+        {"$group": {"_id": None, **totals}},
+        {"$project": {"_id": 0}}
+    ]
+
+def _empty_rsvp_stats() -> Dict:
+    """Stats for an event without RSVPs"""
+    result = dict.fromkeys(_RSVP_STATUSES, 0)
+    result['total_guests'] = 0
+    return result
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client() -> MongoClient:
+    """Return the process-wide MongoClient, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # One pooled client per process; never create one per request
+                _client = MongoClient(
+                    Config.MONGO_URI,
+                    maxPoolSize=100,
+                    minPoolSize=10,
+                    connectTimeoutMS=5000,
+                    serverSelectionTimeoutMS=3000
+                )
+    return _client
+
+def get_collection(name: str):
+    """Get a collection from the shared client"""
+    return get_client()[Config.MONGO_DB_NAME][name]
 
 class BaseModel:
     """Base model class with common functionality"""
     
-    def __init__(self, collection):
+    collection_name = None
+    
+    def __init__(self, collection=None):
+        # Accept a collection handle, a collection name, or fall back to the model default
+        if collection is None:
+            collection = self.collection_name
+        if isinstance(collection, str):
+            collection = get_collection(collection)
         self.collection = collection
     
     def create_indexes(self):
         """Create database indexes for better performance"""
         pass
     
+    def _changed_filter(self, doc_id, update_data: Dict) -> Dict:
+        """Match the document only if at least one field in update_data differs"""
+        # Unchanged documents then skip the write (and the updated_at stamp) server-side.
+        # $expr compares whole values; a query {field: {"$ne": value}} would match array elements.
+        return {
+            "_id": _oid(doc_id),
+            "$expr": {"$or": [{"$ne": ["$" + field, {"$literal": value}]} for field, value in update_data.items()]}
+        }
+    
     def validate_required_fields(self, data: Dict, required_fields: List[str]) -> List[str]:
         """Validate that all required fields are present"""
         missing_fields = []
@@ -29,15 +169,29 @@ class BaseModel:
 class UserModel(BaseModel):
     """User model with enhanced functionality"""
     
-    def __init__(self, collection):
+    collection_name = 'users'
+    
+    def __init__(self, collection=None):
         super().__init__(collection)
         self.required_fields = ['name', 'email', 'password_hash', 'role']
+        self._cache = TTLCache()
+    
+    @staticmethod
+    def _defaults() -> Dict:
+        """Default fields for new users (fresh containers on every call)"""
+        return {
+            'preferences': {'email': True, 'sms': False, 'push': True},
+            'role': 'alumni'
+        }
     
     def create_indexes(self):
         """Create indexes for users collection"""
-        self.collection.create_index("email", unique=True)
-        self.collection.create_index("role")
-        self.collection.create_index("created_at")
+        self.collection.create_indexes([
+            IndexModel("email", unique=True),
+            IndexModel("role"),
+            IndexModel("created_at"),
+            IndexModel([("is_admin", 1), ("is_active", 1), ("name", 1), ("email", 1)], name=ADMIN_ACTIVE_INDEX)
+        ])
     
     def validate_user_data(self, data: Dict) -> List[str]:
         """Validate user data"""
@@ -64,72 +218,111 @@ class UserModel(BaseModel):
     
     def _is_valid_email(self, email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        # Cheap rejects for obviously malformed input before running the regex
+        if not email or len(email) > 254 or email.count('@') != 1:
+            return False
+        if '.' not in email.partition('@')[2]:
+            return False
+        return _EMAIL_RE.match(email) is not None
     
     def _is_valid_phone(self, phone: str) -> bool:
         """Validate phone number format"""
-        pattern = r'^\+?[\d\s\-\(\)]{10,}$'
-        return re.match(pattern, phone) is not None
+        return _PHONE_RE.match(phone) is not None
+    
+    def _prepare_user(self, user_data: Dict, now: datetime) -> Dict:
+        """Stamp timestamps and apply defaults to a new user document"""
+        user_data['created_at'] = now
+        user_data['updated_at'] = now
+        
+        # Fill in default preferences and role in one sweep
+        for field, default in self._defaults().items():
+            user_data.setdefault(field, default)
+        
+        return user_data
     
     def create_user(self, user_data: Dict) -> Dict:
         """Create a new user"""
-        # Add timestamps
-        user_data['created_at'] = datetime.utcnow()
-        user_data['updated_at'] = datetime.utcnow()
-        
-        # Set default preferences
-        if 'preferences' not in user_data:
-            user_data['preferences'] = {
-                'email': True,
-                'sms': False,
-                'push': True
-            }
-        
-        # Set default role if not provided
-        if 'role' not in user_data:
-            user_data['role'] = 'alumni'
+        self._prepare_user(user_data, datetime.utcnow())
         
         result = self.collection.insert_one(user_data)
         user_data['_id'] = result.inserted_id
         return user_data
     
-    def get_user_by_email(self, email: str) -> Optional[Dict]:
-        """Get user by email"""
-        return self.collection.find_one({"email": email})
+    def create_users(self, users_data: List[Dict]) -> List[Dict]:
+        """Create many users with a single insert_many round-trip"""
+        if not users_data:
+            return []
+        
+        now = datetime.utcnow()
+        for user_data in users_data:
+            self._prepare_user(user_data, now)
+        
+        result = self.collection.insert_many(users_data, ordered=False)
+        for user_data, inserted_id in zip(users_data, result.inserted_ids):
+            user_data['_id'] = inserted_id
+        return users_data
+    
+    def get_user_by_email(self, email: str, projection: Optional[Dict] = None) -> Optional[Dict]:
+        """Get user by email, optionally limited to the projected fields (e.g. AUTH_PROJECTION)"""
+        return self.collection.find_one({"email": email}, projection)
     
     def get_user_by_id(self, user_id: str) -> Optional[Dict]:
         """Get user by ID"""
-        return self.collection.find_one({"_id": ObjectId(user_id)})
+        key = str(user_id)
+        user = self._cache.get(key)
+        if user is None:
+            user = self.collection.find_one({"_id": _oid(user_id)})
+            if user is not None:
+                self._cache.set(key, user)
+        return user
     
     def update_user(self, user_id: str, update_data: Dict) -> bool:
         """Update user data"""
+        if not update_data:
+            return False
+        
+        changed_filter = self._changed_filter(user_id, update_data)
         update_data['updated_at'] = datetime.utcnow()
         result = self.collection.update_one(
-            {"_id": ObjectId(user_id)},
+            changed_filter,
             {"$set": update_data}
         )
+        self._cache.pop(str(user_id))
         return result.modified_count > 0
     
     def delete_user(self, user_id: str) -> bool:
         """Delete user (GDPR compliance)"""
-        result = self.collection.delete_one({"_id": ObjectId(user_id)})
+        result = self.collection.delete_one({"_id": _oid(user_id)})
+        self._cache.pop(str(user_id))
         return result.deleted_count > 0
 
 class EventModel(BaseModel):
     """Event model with enhanced functionality"""
     
-    def __init__(self, collection):
+    collection_name = 'events'
+    
+    def __init__(self, collection=None):
         super().__init__(collection)
         self.required_fields = ['title', 'description', 'start_time', 'end_time', 'venue', 'capacity', 'created_by']
+        self._cache = TTLCache()
+    
+    @staticmethod
+    def _defaults() -> Dict:
+        """Default fields for new events (fresh containers on every call)"""
+        return {'timezone': 'UTC', 'tags': [], 'attachments': []}
     
     def create_indexes(self):
         """Create indexes for events collection"""
-        self.collection.create_index("start_time")
-        self.collection.create_index("created_by")
-        self.collection.create_index("tags")
-        self.collection.create_index("rsvp_deadline")
-        self.collection.create_index([("start_time", 1), ("end_time", 1)])
+        self.collection.create_indexes([
+            IndexModel("start_time"),
+            IndexModel("created_by"),
+            IndexModel("tags"),
+            IndexModel("rsvp_deadline"),
+            IndexModel([("start_time", 1), ("end_time", 1)]),
+            # Covers get_upcoming_event_summaries so it never has to fetch full documents
+            IndexModel([("start_time", 1), ("title", 1), ("venue", 1), ("capacity", 1), ("_id", 1)]),
+            IndexModel([("title", "text"), ("description", "text"), ("venue", "text")], name="events_text")
+        ])
     
     def validate_event_data(self, data: Dict) -> List[str]:
         """Validate event data"""
@@ -150,36 +343,53 @@ class EventModel(BaseModel):
             errors.append("Capacity must be a positive integer")
         
         # Validate timezone
-        if 'timezone' in data and data['timezone'] not in pytz.all_timezones:
+        if 'timezone' in data and data['timezone'] not in _ALL_TIMEZONES:
             errors.append("Invalid timezone")
         
         return errors
     
-    def create_event(self, event_data: Dict) -> Dict:
-        """Create a new event"""
-        # Add timestamps
-        event_data['created_at'] = datetime.utcnow()
-        event_data['updated_at'] = datetime.utcnow()
-        
-        # Set default timezone if not provided
-        if 'timezone' not in event_data:
-            event_data['timezone'] = 'UTC'
+    def _prepare_event(self, event_data: Dict, now: datetime) -> Dict:
+        """Stamp timestamps and apply defaults to a new event document"""
+        event_data['created_at'] = now
+        event_data['updated_at'] = now
         
-        # Set default tags if not provided
-        if 'tags' not in event_data:
-            event_data['tags'] = []
+        # Fill in default timezone, tags and attachments in one sweep
+        for field, default in self._defaults().items():
+            event_data.setdefault(field, default)
         
-        # Set default attachments if not provided
-        if 'attachments' not in event_data:
-            event_data['attachments'] = []
+        return event_data
+    
+    def create_event(self, event_data: Dict) -> Dict:
+        """Create a new event"""
+        self._prepare_event(event_data, datetime.utcnow())
         
         result = self.collection.insert_one(event_data)
         event_data['_id'] = result.inserted_id
         return event_data
     
+    def create_events(self, events_data: List[Dict]) -> List[Dict]:
+        """Create many events with a single insert_many round-trip"""
+        if not events_data:
+            return []
+        
+        now = datetime.utcnow()
+        for event_data in events_data:
+            self._prepare_event(event_data, now)
+        
+        result = self.collection.insert_many(events_data, ordered=False)
+        for event_data, inserted_id in zip(events_data, result.inserted_ids):
+            event_data['_id'] = inserted_id
+        return events_data
+    
     def get_event_by_id(self, event_id: str) -> Optional[Dict]:
         """Get event by ID"""
-        return self.collection.find_one({"_id": ObjectId(event_id)})
+        key = str(event_id)
+        event = self._cache.get(key)
+        if event is None:
+            event = self.collection.find_one({"_id": _oid(event_id)})
+            if event is not None:
+                self._cache.set(key, event)
+        return event
     
     def get_upcoming_events(self, limit: int = 10) -> List[Dict]:
         """Get upcoming events"""
@@ -188,6 +398,14 @@ class EventModel(BaseModel):
             {"start_time": {"$gte": now}}
         ).sort("start_time", 1).limit(limit))
     
+    def get_upcoming_event_summaries(self, limit: int = 10) -> List[Dict]:
+        """Get upcoming events with list-view fields only, served from a covering index"""
+        now = datetime.utcnow()
+        return list(self.collection.find(
+            {"start_time": {"$gte": now}},
+            UPCOMING_EVENT_PROJECTION
+        ).sort("start_time", 1).limit(limit))
+    
     def search_events(self, query: Dict, page: int = 1, per_page: int = 10) -> Dict:
         """Search events with pagination"""
         skip = (page - 1) * per_page
@@ -195,12 +413,14 @@ class EventModel(BaseModel):
         # Build search query
         search_query = {}
         
-        if 'search' in query and query['search']:
-            search_query['$or'] = [
-                {"title": {"$regex": query['search'], "$options": "i"}},
-                {"description": {"$regex": query['search'], "$options": "i"}},
-                {"venue": {"$regex": query['search'], "$options": "i"}}
-            ]
+        # Full-text search uses the events_text index instead of scanning with $regex;
+        # terms too short to be indexed words fall back to an anchored title prefix match
+        search_term = (query.get('search') or '').strip()
+        text_search = len(search_term) >= _MIN_TEXT_SEARCH_LENGTH
+        if text_search:
+            search_query['$text'] = {"$search": search_term}
+        elif search_term:
+            search_query['title'] = {"$regex": _prefix_pattern(search_term), "$options": "i"}
         
         if 'tags' in query and query['tags']:
             search_query['tags'] = {"$in": query['tags']}
@@ -214,14 +434,22 @@ class EventModel(BaseModel):
             else:
                 search_query['start_time'] = {"$lte": query['date_to']}
         
-        # Get total count
-        total = self.collection.count_documents(search_query)
-        
-        # Get events
-        events = list(self.collection.find(search_query)
-                     .sort("start_time", 1)
-                     .skip(skip)
-                     .limit(per_page))
+        # Evaluate the filter once and branch into the page and the total count
+        pipeline = [{"$match": search_query}]
+        if text_search:
+            # Best text matches first when searching
+            pipeline.append({"$addFields": {"score": {"$meta": "textScore"}}})
+            sort = {"score": -1, "start_time": 1}
+        else:
+            sort = {"start_time": 1}
+        
+        pipeline.append({"$facet": {
+            "events": [{"$sort": sort}, {"$skip": skip}, {"$limit": per_page}],
+            "meta": [{"$count": "total"}]
+        }})
+        result = next(self.collection.aggregate(pipeline), {"events": [], "meta": []})
+        events = result['events']
+        total = result['meta'][0]['total'] if result['meta'] else 0
         
         return {
             'events': events,
@@ -233,32 +461,49 @@ class EventModel(BaseModel):
     
     def update_event(self, event_id: str, update_data: Dict) -> bool:
         """Update event data"""
+        if not update_data:
+            return False
+        
+        changed_filter = self._changed_filter(event_id, update_data)
         update_data['updated_at'] = datetime.utcnow()
         result = self.collection.update_one(
-            {"_id": ObjectId(event_id)},
+            changed_filter,
             {"$set": update_data}
         )
+        self._cache.pop(str(event_id))
         return result.modified_count > 0
     
     def delete_event(self, event_id: str) -> bool:
         """Delete event"""
-        result = self.collection.delete_one({"_id": ObjectId(event_id)})
+        result = self.collection.delete_one({"_id": _oid(event_id)})
+        self._cache.pop(str(event_id))
         return result.deleted_count > 0
 
 class RSVPModel(BaseModel):
     """RSVP model with enhanced functionality"""
     
-    def __init__(self, collection):
+    collection_name = 'rsvps'
+    
+    def __init__(self, collection=None):
         super().__init__(collection)
         self.required_fields = ['event_id', 'user_id', 'status']
+        self._cache = TTLCache()
     
     def create_indexes(self):
         """Create indexes for RSVPs collection"""
-        self.collection.create_index([("event_id", 1), ("user_id", 1)], unique=True)
-        self.collection.create_index("event_id")
-        self.collection.create_index("user_id")
-        self.collection.create_index("status")
-        self.collection.create_index("created_at")
+        self.collection.create_indexes([
+            IndexModel([("event_id", 1), ("user_id", 1)], unique=True),
+            IndexModel("event_id"),
+            IndexModel("user_id"),
+            IndexModel([("event_id", 1), ("status", 1)]),
+            IndexModel("created_at")
+        ])
+        
+        # The compound (event_id, status) index supersedes the old standalone one
+        try:
+            self.collection.drop_index("status_1")
+        except OperationFailure:
+            pass
     
     def validate_rsvp_data(self, data: Dict) -> List[str]:
         """Validate RSVP data"""
@@ -270,9 +515,8 @@ class RSVPModel(BaseModel):
             errors.append(f"Missing required fields: {', '.join(missing_fields)}")
         
         # Validate status
-        valid_statuses = ['going', 'maybe', 'not_going', 'waitlist']
-        if 'status' in data and data['status'] not in valid_statuses:
-            errors.append(f"Status must be one of: {', '.join(valid_statuses)}")
+        if 'status' in data and data['status'] not in _RSVP_STATUS_SET:
+            errors.append(f"Status must be one of: {', '.join(_RSVP_STATUSES)}")
         
         # Validate guests count
         if 'guests' in data and (not isinstance(data['guests'], int) or data['guests'] < 0):
@@ -282,80 +526,104 @@ class RSVPModel(BaseModel):
     
     def create_rsvp(self, rsvp_data: Dict) -> Dict:
         """Create a new RSVP"""
-        rsvp_data['created_at'] = datetime.utcnow()
-        rsvp_data['updated_at'] = datetime.utcnow()
+        now = datetime.utcnow()
+        rsvp_data['created_at'] = now
+        rsvp_data['updated_at'] = now
         
         result = self.collection.insert_one(rsvp_data)
         rsvp_data['_id'] = result.inserted_id
         return rsvp_data
     
+    def create_rsvps(self, rsvps_data: List[Dict]) -> List[Dict]:
+        """Create many RSVPs in one bulk write, skipping (event, user) pairs that already exist"""
+        if not rsvps_data:
+            return []
+        
+        now = datetime.utcnow()
+        operations = []
+        for rsvp_data in rsvps_data:
+            rsvp_data['created_at'] = now
+            rsvp_data['updated_at'] = now
+            # The unique (event_id, user_id) index makes the upsert an insert-if-absent
+            key = {"event_id": rsvp_data['event_id'], "user_id": rsvp_data['user_id']}
+            insert_fields = {k: v for k, v in rsvp_data.items() if k not in key}
+            operations.append(UpdateOne(key, {"$setOnInsert": insert_fields}, upsert=True))
+        
+        result = self.collection.bulk_write(operations, ordered=False)
+        created = []
+        for index, upserted_id in result.upserted_ids.items():
+            rsvps_data[index]['_id'] = upserted_id
+            created.append(rsvps_data[index])
+        return created
+    
     def get_rsvp_by_event_and_user(self, event_id: str, user_id: str) -> Optional[Dict]:
         """Get RSVP by event and user"""
-        return self.collection.find_one({
-            "event_id": ObjectId(event_id),
-            "user_id": ObjectId(user_id)
-        })
+        key = (str(event_id), str(user_id))
+        rsvp = self._cache.get(key)
+        if rsvp is None:
+            rsvp = self.collection.find_one({
+                "event_id": _oid(event_id),
+                "user_id": _oid(user_id)
+            })
+            if rsvp is not None:
+                self._cache.set(key, rsvp)
+        return rsvp
+    
+    def iter_rsvps_by_event(self, event_id: str, batch_size: int = 500):
+        """Stream RSVPs for an event in batches instead of loading them all at once"""
+        return self.collection.find({"event_id": _oid(event_id)}).batch_size(batch_size)
     
     def get_rsvps_by_event(self, event_id: str) -> List[Dict]:
-        """Get all RSVPs for an event"""
-        return list(self.collection.find({"event_id": ObjectId(event_id)}))
+        """Get all RSVPs for an event (prefer iter_rsvps_by_event for large events)"""
+        return list(self.iter_rsvps_by_event(event_id))
     
     def get_rsvp_stats(self, event_id: str) -> Dict:
         """Get RSVP statistics for an event"""
-        pipeline = [
-            {"$match": {"event_id": ObjectId(event_id)}},
-            {"$group": {
-                "_id": "$status",
-                "count": {"$sum": 1},
-                "total_guests": {"$sum": "$guests"}
-            }}
-        ]
-        
-        stats = list(self.collection.aggregate(pipeline))
-        
-        result = {
-            'going': 0,
-            'maybe': 0,
-            'not_going': 0,
-            'waitlist': 0,
-            'total_guests': 0
-        }
-        
-        for stat in stats:
-            status = stat['_id']
-            if status in result:
-                result[status] = stat['count']
-                result['total_guests'] += stat['total_guests']
-        
-        return result
+        result = next(self.collection.aggregate(_rsvp_stats_pipeline(event_id)), None)
+        return result if result is not None else _empty_rsvp_stats()
     
     def update_rsvp(self, rsvp_id: str, update_data: Dict) -> bool:
         """Update RSVP data"""
+        if not update_data:
+            return False
+        
+        changed_filter = self._changed_filter(rsvp_id, update_data)
         update_data['updated_at'] = datetime.utcnow()
         result = self.collection.update_one(
-            {"_id": ObjectId(rsvp_id)},
+            changed_filter,
             {"$set": update_data}
         )
+        # Cached RSVPs are keyed by (event, user), not by RSVP id
+        self._cache.clear()
         return result.modified_count > 0
     
     def delete_rsvp(self, rsvp_id: str) -> bool:
         """Delete RSVP"""
-        result = self.collection.delete_one({"_id": ObjectId(rsvp_id)})
+        result = self.collection.delete_one({"_id": _oid(rsvp_id)})
+        self._cache.clear()
         return result.deleted_count > 0
 
 class NotificationModel(BaseModel):
     """Notification model for tracking sent notifications"""
     
-    def __init__(self, collection):
+    collection_name = 'notifications'
+    
+    def __init__(self, collection=None):
         super().__init__(collection)
         self.required_fields = ['user_id', 'type', 'subject', 'content']
+        # Status bookkeeping is fire-and-forget; creates keep the acknowledged write concern
+        self._audit_collection = self.collection.with_options(write_concern=WriteConcern(w=0))
     
     def create_indexes(self):
         """Create indexes for notifications collection"""
-        self.collection.create_index("user_id")
-        self.collection.create_index("type")
-        self.collection.create_index("sent_at")
-        self.collection.create_index("status")
+        self.collection.create_indexes([
+            IndexModel("user_id"),
+            IndexModel("type"),
+            IndexModel("sent_at"),
+            IndexModel("status"),
+            # Unread-count and latest-first listing per user (navbar banner, notifications page)
+            IndexModel([("user_id", 1), ("read", 1), ("created_at", -1)], name=USER_READ_CREATED_INDEX)
+        ])
     
     def create_notification(self, notification_data: Dict) -> Dict:
         """Create a new notification record"""
@@ -368,8 +636,8 @@ class NotificationModel(BaseModel):
     
     def mark_sent(self, notification_id: str) -> bool:
         """Mark notification as sent"""
-        result = self.collection.update_one(
-            {"_id": ObjectId(notification_id)},
+        self._audit_collection.update_one(
+            {"_id": _oid(notification_id)},
             {
                 "$set": {
                     "status": "sent",
@@ -377,12 +645,13 @@ class NotificationModel(BaseModel):
                 }
             }
         )
-        return result.modified_count > 0
+        # Unacknowledged writes report no match counts; True means the update was sent
+        return True
     
     def mark_failed(self, notification_id: str, error_message: str) -> bool:
         """Mark notification as failed"""
-        result = self.collection.update_one(
-            {"_id": ObjectId(notification_id)},
+        self._audit_collection.update_one(
+            {"_id": _oid(notification_id)},
             {
                 "$set": {
                     "status": "failed",
@@ -391,4 +660,4 @@ class NotificationModel(BaseModel):
                 }
             }
         )
-        return result.modified_count > 0
+        return True
@@ -2,17 +2,28 @@
 Advanced notification system for Alumni Event Scheduler
 Supports Email, SMS, and Push notifications with templates
 """
+import asyncio
 import os
 import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import ChainMap
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from jinja2 import Template
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple
+from jinja2 import Environment
 import pytz
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Email providers
 try:
     from sendgrid import SendGridAPIClient
-    from sendgrid.helpers.mail import Mail
+    from sendgrid.helpers.mail import Mail, Personalization, Substitution, To
     SENDGRID_AVAILABLE = True
 except ImportError:
     SENDGRID_AVAILABLE = False
@@ -20,6 +31,7 @@ except ImportError:
 # SMS provider
 try:
     from twilio.rest import Client as TwilioClient
+    from twilio.http.http_client import TwilioHttpClient
     TWILIO_AVAILABLE = True
 except ImportError:
     TWILIO_AVAILABLE = False
@@ -32,16 +44,92 @@ try:
 except ImportError:
     FCM_AVAILABLE = False
 
+from flask import current_app, has_app_context
 from flask_mail import Mail as FlaskMail, Message
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# User fields the senders read; queued tasks carry only these so payloads stay JSON-serializable
+TASK_USER_FIELDS = ('name', 'email', 'phone', 'preferences', 'device_tokens')
+
+# Seconds to send inline after the Celery broker refused a task, before trying it again
+BROKER_RETRY_INTERVAL = 30
+_broker_down_until = 0.0
+
+# Shared read-only stand-in for users without preferences
+_EMPTY_PREFS = MappingProxyType({})
+
+# SendGrid limits for a single mail send request
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+SENDGRID_MAX_PAYLOAD_BYTES = 30 * 1024 * 1024
+SENDGRID_SEND_URL = 'https://api.sendgrid.com/v3/mail/send'
+
+# FCM accepts at most 500 tokens per multicast and 500 messages per batch
+FCM_MAX_BATCH = 500
+
+class _ProviderRetry(Retry):
+    """Retry that honours Retry-After on 429 only; a 413/503 POST is never resent"""
+    RETRY_AFTER_STATUS_CODES = frozenset({429})
+
+def _provider_retry() -> Retry:
+    """Retry policy for provider APIs that only repeats a POST the provider never processed.
+
+    Connect failures (nothing was sent) and 429s (rejected before processing) are retried;
+    read timeouts and 5xx are not, since the provider may already have sent the messages.
+    """
+    return _ProviderRetry(total=3, connect=3, read=False, other=0, status=3, backoff_factor=0.5,
+                          status_forcelist=[429], allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+                          respect_retry_after_header=True)
+
+def _build_http_session() -> requests.Session:
+    """Keep-alive HTTPS session so provider calls reuse pooled connections instead of new TLS handshakes"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=_provider_retry()))
+    return session
+
+_JINJA_VARIABLE = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+class _FormatVariables(ChainMap):
+    """format_map view over the variables that renders missing ones as empty, like Jinja"""
+    
+    def __missing__(self, key):
+        return ''
+
+def _to_format_string(body: str) -> Optional[str]:
+    """Convert a one-line template made only of {{ name }} substitutions to a str.format string"""
+    parts = _JINJA_VARIABLE.split(body)
+    literals = parts[0::2]
+    if '\n' in body or any('{' in literal or '}' in literal for literal in literals):
+        return None
+    # split() alternates literal text and variable names
+    return ''.join(part if i % 2 == 0 else '{' + part + '}' for i, part in enumerate(parts))
+
+_JINJA_TAG = re.compile(r'\{\{.*?\}\}|\{%.*?%\}', re.S)
+_MAX_PARTIALS = 256
+
+class PartialTemplate:
+    """A template pre-rendered with its shared variables, leaving only plain per-user substitutions"""
+    
+    def __init__(self, format_string: str):
+        self.format_string = format_string
+    
+    def render(self, **variables) -> str:
+        return self.format_string.format_map(_FormatVariables(variables))
+
+def _only_plain_outputs(source: str, names) -> bool:
+    """True when each name is used only as a bare {{ name }} output, never in logic or filters"""
+    for name in names:
+        stripped = re.sub(r'\{\{\s*' + re.escape(name) + r'\s*\}\}', '', source)
+        if any(re.search(r'\b' + re.escape(name) + r'\b', tag) for tag in _JINJA_TAG.findall(stripped)):
+            return False
+    return True
+
 class NotificationTemplate:
     """Notification template handler"""
     
     def __init__(self):
-        self.templates = {
+        sources = {
             'event_created': {
                 'subject': 'New Alumni Event: {{event_title}}',
                 'email_body': '''
@@ -116,6 +204,20 @@ class NotificationTemplate:
                 'push_body': '{{event_title}} has been cancelled'
             }
         }
+        
+        self.sources = sources
+        self._partials = {}
+        self._partials_lock = threading.Lock()
+        
+        # Parse every template once; plain substitutions become format strings, the rest compiled Jinja
+        env = Environment()
+        self.templates = {
+            name: {
+                template_type: _to_format_string(body) or env.from_string(body)
+                for template_type, body in parts.items()
+            }
+            for name, parts in sources.items()
+        }
     
     def render_template(self, template_name: str, template_type: str, variables: Dict[str, Any]) -> str:
         """Render a notification template with variables"""
@@ -125,20 +227,65 @@ class NotificationTemplate:
         if template_type not in self.templates[template_name]:
             raise ValueError(f"Template type {template_type} not found in {template_name}")
         
-        template_content = self.templates[template_name][template_type]
-        template = Template(template_content)
+        template = self.templates[template_name][template_type]
+        if isinstance(template, str):
+            return template.format_map(_FormatVariables(variables))
+        
+        # Shared variables layered over per-user keys: reuse the specialization for the shared part
+        if isinstance(variables, ChainMap) and len(variables.maps) == 2:
+            shared, per_user = variables.maps
+            partial = self.render_partial(template_name, template_type, shared,
+                                          [key for key in per_user if key not in shared])
+            if partial is not None:
+                return partial.render(**per_user)
         return template.render(**variables)
+    
+    def render_partial(self, template_name: str, template_type: str, fixed_vars: Dict[str, Any],
+                       free_vars=('user_name', 'user_email')) -> Optional[PartialTemplate]:
+        """Render a template once with fixed_vars, keeping free_vars as substitutions; None if unsupported"""
+        try:
+            key = (template_name, template_type, frozenset(fixed_vars.items()), frozenset(free_vars))
+        except TypeError:
+            return None  # Unhashable values cannot be memoized
+        partial = self._partials.get(key)
+        if partial is not None:
+            return partial
+        
+        template = self.templates[template_name][template_type]
+        source = self.sources[template_name][template_type]
+        if isinstance(template, str) or not _only_plain_outputs(source, free_vars):
+            return None
+        
+        # Render with marker values for the free variables, then turn the markers into format fields
+        markers = {name: f'\x00{name}\x00' for name in free_vars}
+        rendered = template.render(**{**fixed_vars, **markers})
+        format_string = rendered.replace('{', '{{').replace('}', '}}')
+        for name, marker in markers.items():
+            format_string = format_string.replace(marker, '{' + name + '}')
+        partial = PartialTemplate(format_string)
+        
+        with self._partials_lock:
+            if len(self._partials) >= _MAX_PARTIALS:
+                self._partials.clear()
+            self._partials[key] = partial
+        return partial
+
+# Shared by every service so the templates are compiled once per process
+_TEMPLATE_HANDLER = NotificationTemplate()
 
 class EmailNotificationService:
     """Email notification service using SendGrid and Flask-Mail as fallback"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, template_handler: NotificationTemplate = None):
         self.config = config
-        self.template_handler = NotificationTemplate()
+        self.template_handler = template_handler or _TEMPLATE_HANDLER
         
         # Initialize SendGrid if available
         if SENDGRID_AVAILABLE and config.SENDGRID_API_KEY:
             self.sendgrid_client = SendGridAPIClient(api_key=config.SENDGRID_API_KEY)
+            # python_http_client opens a new connection per request; post through a pooled session instead
+            self.http_session = _build_http_session()
+            self.http_session.headers.update({'Authorization': f'Bearer {config.SENDGRID_API_KEY}'})
         else:
             self.sendgrid_client = None
             logger.warning("SendGrid not available, using Flask-Mail as fallback")
@@ -169,15 +316,16 @@ class EmailNotificationService:
         if text_content:
             message.plain_text_content = text_content
         
-        response = self.sendgrid_client.send(message)
+        return self._post_to_sendgrid(message)
+    
+    def _post_to_sendgrid(self, message) -> bool:
+        """POST a prepared Mail to SendGrid over the pooled session"""
+        response = self.http_session.post(SENDGRID_SEND_URL, json=message.get(), timeout=30)
         return response.status_code in [200, 201, 202]
     
     def _send_via_flask_mail(self, to_email: str, subject: str, html_content: str, 
                             text_content: str = None, from_email: str = None) -> bool:
         """Send email via Flask-Mail (fallback)"""
-        from flask import current_app
-        from flask_mail import Message
-        
         msg = Message(
             subject=subject,
             recipients=[to_email],
@@ -202,16 +350,75 @@ class EmailNotificationService:
         except Exception as e:
             logger.error(f"Failed to send template email: {str(e)}")
             return False
+    
+    def send_bulk_template_email(self, recipients: List[Tuple[str, Dict[str, Any]]], template_name: str,
+                                 common_vars: Dict[str, Any]) -> Dict[str, bool]:
+        """Send one templated email to many recipients, batching them into SendGrid personalizations"""
+        if not self.sendgrid_client:
+            return {to_email: self.send_template_email(to_email, template_name, {**user_vars, **common_vars})
+                    for to_email, user_vars in recipients}
+        
+        # Render once with per-recipient values left as -key- substitution tags
+        per_user_keys = {key for _, user_vars in recipients for key in user_vars if key not in common_vars}
+        variables = {**{key: f'-{key}-' for key in per_user_keys}, **common_vars}
+        try:
+            subject = self.template_handler.render_template(template_name, 'subject', variables)
+            html_content = self.template_handler.render_template(template_name, 'email_body', variables)
+            text_content = self.template_handler.render_template(template_name, 'sms_body', variables)
+        except Exception as e:
+            logger.error(f"Failed to render bulk template email: {str(e)}")
+            return {to_email: False for to_email, _ in recipients}
+        
+        results = {}
+        base_size = len(subject) + len(html_content) + len(text_content) + 1024
+        batch, batch_size = [], base_size
+        for to_email, user_vars in recipients:
+            substitutions = {f'-{key}-': str(user_vars.get(key, '')) for key in per_user_keys}
+            size = len(to_email) + sum(len(k) + len(v) + 8 for k, v in substitutions.items()) + 64
+            if batch and (len(batch) >= SENDGRID_MAX_PERSONALIZATIONS or batch_size + size > SENDGRID_MAX_PAYLOAD_BYTES):
+                results.update(self._send_sendgrid_batch(batch, subject, html_content, text_content))
+                batch, batch_size = [], base_size
+            batch.append((to_email, substitutions))
+            batch_size += size
+        if batch:
+            results.update(self._send_sendgrid_batch(batch, subject, html_content, text_content))
+        return results
+    
+    def _send_sendgrid_batch(self, batch: List[Tuple[str, Dict[str, str]]], subject: str,
+                             html_content: str, text_content: str) -> Dict[str, bool]:
+        """Send one SendGrid request with a personalization per recipient"""
+        try:
+            message = Mail(
+                from_email=self.config.MAIL_USERNAME,
+                subject=subject,
+                html_content=html_content,
+                plain_text_content=text_content
+            )
+            for to_email, substitutions in batch:
+                personalization = Personalization()
+                personalization.add_to(To(to_email))
+                for key, value in substitutions.items():
+                    personalization.add_substitution(Substitution(key, value))
+                message.add_personalization(personalization)
+            
+            sent = self._post_to_sendgrid(message)
+        except Exception as e:
+            logger.error(f"Failed to send bulk email batch of {len(batch)}: {str(e)}")
+            sent = False
+        return {to_email: sent for to_email, _ in batch}
 
 class SMSNotificationService:
     """SMS notification service using Twilio"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, template_handler: NotificationTemplate = None):
         self.config = config
-        self.template_handler = NotificationTemplate()
+        self.template_handler = template_handler or _TEMPLATE_HANDLER
         
         if TWILIO_AVAILABLE and config.TWILIO_SID and config.TWILIO_AUTH_TOKEN:
-            self.twilio_client = TwilioClient(config.TWILIO_SID, config.TWILIO_AUTH_TOKEN)
+            self.twilio_client = TwilioClient(
+                config.TWILIO_SID, config.TWILIO_AUTH_TOKEN,
+                http_client=TwilioHttpClient(pool_connections=True, max_retries=_provider_retry())
+            )
         else:
             self.twilio_client = None
             logger.warning("Twilio not available")
@@ -246,9 +453,9 @@ class SMSNotificationService:
 class PushNotificationService:
     """Push notification service using Firebase Cloud Messaging"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, template_handler: NotificationTemplate = None):
         self.config = config
-        self.template_handler = NotificationTemplate()
+        self.template_handler = template_handler or _TEMPLATE_HANDLER
         
         if FCM_AVAILABLE and config.FCM_SERVER_KEY:
             # Initialize Firebase Admin SDK
@@ -302,35 +509,91 @@ class PushNotificationService:
         except Exception as e:
             logger.error(f"Failed to send template push notification: {str(e)}")
             return False
+    
+    def send_bulk_template_push(self, user_tokens_and_vars: List[Tuple[List[str], Dict[str, Any]]],
+                                template_name: str) -> List[bool]:
+        """Send templated pushes to many users in FCM batches; returns one result per entry"""
+        if not self.fcm_available:
+            logger.error("FCM not available")
+            return [False] * len(user_tokens_and_vars)
+        
+        try:
+            rendered = [
+                (self.template_handler.render_template(template_name, 'push_title', variables),
+                 self.template_handler.render_template(template_name, 'push_body', variables))
+                for _, variables in user_tokens_and_vars
+            ]
+        except Exception as e:
+            logger.error(f"Failed to render bulk template push: {str(e)}")
+            return [False] * len(user_tokens_and_vars)
+        
+        # (entry index, token) pairs, so per-token responses map back to users
+        targets = [(index, token) for index, (tokens, _) in enumerate(user_tokens_and_vars) for token in tokens]
+        results = [False] * len(user_tokens_and_vars)
+        shared = len(set(rendered)) == 1
+        for start in range(0, len(targets), FCM_MAX_BATCH):
+            batch = targets[start:start + FCM_MAX_BATCH]
+            try:
+                if shared:
+                    # Everyone gets the same text: one multicast per 500 tokens
+                    title, body = rendered[0]
+                    response = messaging.send_multicast(messaging.MulticastMessage(
+                        notification=messaging.Notification(title=title, body=body),
+                        tokens=[token for _, token in batch]
+                    ))
+                else:
+                    response = messaging.send_all([
+                        messaging.Message(
+                            notification=messaging.Notification(title=rendered[index][0], body=rendered[index][1]),
+                            token=token
+                        )
+                        for index, token in batch
+                    ])
+            except Exception as e:
+                logger.error(f"Failed to send push batch of {len(batch)}: {str(e)}")
+                continue
+            for (index, _), send_response in zip(batch, response.responses):
+                results[index] = results[index] or send_response.success
+        return results
 
 class NotificationManager:
     """Main notification manager that coordinates all notification services"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, template_handler: NotificationTemplate = None):
         self.config = config
-        self.email_service = EmailNotificationService(config)
-        self.sms_service = SMSNotificationService(config)
-        self.push_service = PushNotificationService(config)
-        self.template_handler = NotificationTemplate()
+        self.template_handler = template_handler or _TEMPLATE_HANDLER
+        self.email_service = EmailNotificationService(config, self.template_handler)
+        self.sms_service = SMSNotificationService(config, self.template_handler)
+        self.push_service = PushNotificationService(config, self.template_handler)
+        # Link formats are fixed per config; only the event id varies
+        self._event_url_fmt = f"{config.FRONTEND_URL}/events/{{id}}"
+        self._rsvp_url_fmt = self._event_url_fmt + "#rsvp"
     
     def send_notification(self, user: Dict, notification_type: str, template_name: str, 
-                         variables: Dict[str, Any], channels: List[str] = None) -> Dict[str, bool]:
-        """Send notification through specified channels"""
+                         variables: Dict[str, Any], channels: List[str] = None,
+                         queue: bool = False) -> Dict[str, bool]:
+        """Send notification through specified channels; queue=True hands it to a Celery worker instead"""
         if channels is None:
             channels = ['email']  # Default to email only
         
+        if queue:
+            task = _celery_task('send_notification_task')
+            if task is not None and _enqueue(task, _task_user(user), template_name, dict(variables), channels):
+                # Return immediately; a worker makes the provider calls
+                return {'queued': True}
+        
         results = {}
         
-        # Prepare common variables
-        common_vars = {
+        # Layer the two user keys under the shared variables instead of copying them per user
+        common_vars = ChainMap(variables, {
             'user_name': user.get('name', 'Alumni'),
-            'user_email': user.get('email', ''),
-            **variables
-        }
+            'user_email': user.get('email', '')
+        })
+        eligible = self._eligible_channels(user, channels)
         
         # Send via email
-        if 'email' in channels and self.config.ENABLE_EMAIL_NOTIFICATIONS:
-            if user.get('preferences', {}).get('email', True):
+        if 'email' in eligible:
+            if eligible['email']:
                 results['email'] = self.email_service.send_template_email(
                     user['email'], template_name, common_vars
                 )
@@ -339,55 +602,141 @@ class NotificationManager:
                 logger.info(f"Email notifications disabled for user {user['email']}")
         
         # Send via SMS
-        if 'sms' in channels and self.config.ENABLE_SMS_NOTIFICATIONS:
-            if user.get('preferences', {}).get('sms', False) and user.get('phone'):
-                results['sms'] = self.sms_service.send_template_sms(
-                    user['phone'], template_name, common_vars
-                )
-            else:
-                results['sms'] = False
+        if 'sms' in eligible:
+            results['sms'] = eligible['sms'] and self.sms_service.send_template_sms(
+                user['phone'], template_name, common_vars
+            )
         
         # Send via push notification
-        if 'push' in channels and self.config.ENABLE_PUSH_NOTIFICATIONS:
-            if user.get('preferences', {}).get('push', True) and user.get('device_tokens'):
-                results['push'] = self.push_service.send_template_push(
-                    user['device_tokens'], template_name, common_vars
-                )
-            else:
-                results['push'] = False
+        if 'push' in eligible:
+            results['push'] = eligible['push'] and self.push_service.send_template_push(
+                user['device_tokens'], template_name, common_vars
+            )
         
         return results
     
+    def _eligible_channels(self, user: Dict, channels: List[str]) -> Dict[str, bool]:
+        """Map each requested, enabled channel to whether this user can receive it"""
+        prefs = user.get('preferences') or _EMPTY_PREFS
+        eligible = {}
+        if 'email' in channels and self.config.ENABLE_EMAIL_NOTIFICATIONS:
+            eligible['email'] = bool(prefs.get('email', True))
+        if 'sms' in channels and self.config.ENABLE_SMS_NOTIFICATIONS:
+            eligible['sms'] = bool(prefs.get('sms', False) and user.get('phone'))
+        if 'push' in channels and self.config.ENABLE_PUSH_NOTIFICATIONS:
+            eligible['push'] = bool(prefs.get('push', True) and user.get('device_tokens'))
+        return eligible
+    
     def send_bulk_notification(self, users: List[Dict], template_name: str, 
-                              variables: Dict[str, Any], channels: List[str] = None) -> Dict[str, int]:
-        """Send notification to multiple users"""
+                              variables: Dict[str, Any], channels: List[str] = None,
+                              failed_users: List[Tuple[Dict, List[str]]] = None) -> Dict[str, int]:
+        """Send notification to multiple users; failed_users collects (user, channels) whose sends failed"""
         if channels is None:
             channels = ['email']
         
         results = {'success': 0, 'failed': 0, 'skipped': 0}
+        if not users:
+            return results
+        
+        # One pass over the users decides every channel each of them can receive
+        eligibility = {id(user): self._eligible_channels(user, channels) for user in users}
+        
+        # Email and push go out as provider batches rather than one request per user
+        batched = {}
+        if 'email' in channels and self.config.ENABLE_EMAIL_NOTIFICATIONS and self.email_service.sendgrid_client:
+            recipients = [
+                (user['email'], {'user_name': user.get('name', 'Alumni'), 'user_email': user['email']})
+                for user in users
+                if user.get('email') and eligibility[id(user)]['email']
+            ]
+            sent = self.email_service.send_bulk_template_email(recipients, template_name, variables)
+            batched['email'] = {id(user): sent.get(user.get('email'), False) for user in users}
+            channels = [channel for channel in channels if channel != 'email']
         
+        if 'push' in channels and self.config.ENABLE_PUSH_NOTIFICATIONS and self.push_service.fcm_available:
+            push_users = [user for user in users if eligibility[id(user)]['push']]
+            sent = self.push_service.send_bulk_template_push([
+                (user['device_tokens'], {'user_name': user.get('name', 'Alumni'), 'user_email': user.get('email', ''), **variables})
+                for user in push_users
+            ], template_name)
+            batched['push'] = dict.fromkeys(map(id, users), False)
+            batched['push'].update(zip(map(id, push_users), sent))
+            channels = [channel for channel in channels if channel != 'push']
+        
+        # Workers need the app context for the Flask-Mail fallback
+        app = current_app._get_current_object() if has_app_context() else None
+        
+        # Shared variables are frozen once here and read by every worker without copying
+        if not isinstance(variables, MappingProxyType):
+            variables = MappingProxyType(dict(variables))
+        
+        def send_one(user, user_channels):
+            if app is None:
+                return self.send_notification(user, 'bulk', template_name, variables, user_channels)
+            with app.app_context():
+                return self.send_notification(user, 'bulk', template_name, variables, user_channels)
+        
+        # Only users eligible for a remaining channel need a worker; the rest have nothing to send
+        pending = []
         for user in users:
-            try:
-                user_results = self.send_notification(user, 'bulk', template_name, variables, channels)
-                
-                # Check if any channel succeeded
-                if any(user_results.values()):
-                    results['success'] += 1
-                else:
-                    results['failed'] += 1
-            except Exception as e:
-                logger.error(f"Failed to send notification to user {user.get('email', 'unknown')}: {str(e)}")
+            user_channels = [channel for channel in channels if eligibility[id(user)].get(channel)]
+            if user_channels:
+                pending.append((user, user_channels))
+        
+        # Sends are I/O-bound provider calls, so run them concurrently instead of one after another
+        per_user = {}
+        if pending:
+            max_workers = min(getattr(self.config, 'NOTIFY_CONCURRENCY', 32) or 32, len(pending))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(send_one, user, user_channels): user for user, user_channels in pending}
+                for future in as_completed(futures):
+                    user = futures[future]
+                    try:
+                        per_user[id(user)] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to send notification to user {user.get('email', 'unknown')}: {str(e)}")
+                        per_user[id(user)] = None
+        
+        pending_channels = {id(user): user_channels for user, user_channels in pending}
+        for user in users:
+            user_results = per_user.get(id(user), {})
+            raised = user_results is None
+            if raised:
+                # None of this user's per-user channels are known to have gone out
+                user_results = dict.fromkeys(pending_channels[id(user)], False)
+            for channel, sent in batched.items():
+                user_results[channel] = sent[id(user)]
+            
+            # Check if any channel succeeded
+            if not raised and any(user_results.values()):
+                results['success'] += 1
+            else:
                 results['failed'] += 1
+            
+            if failed_users is not None:
+                # Only channels the user could receive count as failed; opted-out ones are not retried
+                retry = [channel for channel, sent in user_results.items()
+                         if not sent and eligibility[id(user)].get(channel)]
+                if retry:
+                    failed_users.append((user, retry))
         
         return results
     
-    def send_event_reminders(self, event: Dict, users: List[Dict], hours_before: int) -> Dict[str, int]:
-        """Send event reminders to users"""
-        # Calculate time until event
-        now = datetime.utcnow()
-        event_time = event['start_time']
-        if isinstance(event_time, str):
-            event_time = datetime.fromisoformat(event_time.replace('Z', '+00:00'))
+    async def async_send_bulk_notification(self, users: List[Dict], template_name: str,
+                                           variables: Dict[str, Any], channels: List[str] = None,
+                                           failed_users: List[Tuple[Dict, List[str]]] = None) -> Dict[str, int]:
+        """send_bulk_notification for event-loop callers: same provider batching, counts and failed_users"""
+        # The batched SendGrid/FCM requests and the per-user sends run in a worker thread, off the loop
+        return await asyncio.to_thread(self.send_bulk_notification, users, template_name, variables,
+                                       channels, failed_users)
+    
+    def send_event_reminders(self, event: Dict, users: List[Dict], hours_before: int,
+                             queue: bool = False, now: datetime = None) -> Dict[str, int]:
+        """Send event reminders to users; queue=True hands them to a Celery worker instead"""
+        # Calculate time until event; batch callers pass one shared clock reading as now
+        if now is None:
+            now = datetime.utcnow()
+        event_time = _event_time_utc(event['start_time'])
         
         time_until = event_time - now
         time_until_str = f"{time_until.days} days, {time_until.seconds // 3600} hours"
@@ -398,8 +747,71 @@ class NotificationManager:
             'venue': event['venue'],
             'description': event.get('description', ''),
             'time_until': time_until_str,
-            'event_link': f"{self.config.FRONTEND_URL}/events/{event['_id']}",
-            'rsvp_link': f"{self.config.FRONTEND_URL}/events/{event['_id']}#rsvp"
+            'event_link': self._event_url_fmt.format(id=event['_id']),
+            'rsvp_link': self._rsvp_url_fmt.format(id=event['_id'])
         }
+        # Event-scoped values are built once; the read-only view is shared by every recipient
+        variables = MappingProxyType(variables)
+        
+        if queue:
+            task = _celery_task('send_bulk_notification_task')
+            task_users = [_task_user(user) for user in users]
+            if task is not None and _enqueue(task, task_users, 'event_reminder', dict(variables)):
+                # One queued job keeps the batched email path; the web process returns at once
+                return {'success': 0, 'failed': 0, 'skipped': 0, 'queued': len(users)}
         
         return self.send_bulk_notification(users, 'event_reminder', variables)
+    
+    def send_reminders_for_events(self, reminders: List[Tuple[Dict, List[Dict]]], hours_before: int,
+                                  queue: bool = False) -> List[Dict[str, int]]:
+        """Send reminders for several events against a single clock reading"""
+        now = datetime.utcnow()
+        return [self.send_event_reminders(event, users, hours_before, queue=queue, now=now)
+                for event, users in reminders]
+
+@lru_cache(maxsize=4)
+def _manager_for(config) -> NotificationManager:
+    return NotificationManager(config)
+
+def get_notification_manager(config=None) -> NotificationManager:
+    """Return the shared NotificationManager for a config class instead of building one per request"""
+    return _manager_for(config or Config)
+
+@lru_cache(maxsize=256)
+def _parse_event_time(value: str) -> datetime:
+    """Parse an ISO start time once per distinct string"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def _event_time_utc(value) -> datetime:
+    """Return an event start time as a naive UTC datetime, comparable with utcnow()"""
+    if isinstance(value, str):
+        value = _parse_event_time(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(pytz.UTC).replace(tzinfo=None)
+    return value
+
+def _task_user(user: Dict) -> Dict:
+    """Reduce a user document to the JSON-safe fields the senders need"""
+    return {field: user[field] for field in TASK_USER_FIELDS if field in user}
+
+def _celery_task(name: str):
+    """Return a notification task from celery_app, or None when Celery is not installed"""
+    try:
+        import celery_app
+    except ImportError:
+        return None
+    return getattr(celery_app, name)
+
+def _enqueue(task, *args) -> bool:
+    """Queue a task, reporting False when the broker is unreachable so callers can send inline"""
+    global _broker_down_until
+    # After a failed connect, send inline for a while instead of waiting on the broker every call
+    if time.monotonic() < _broker_down_until:
+        return False
+    try:
+        task.delay(*args)
+        return True
+    except Exception as e:
+        _broker_down_until = time.monotonic() + BROKER_RETRY_INTERVAL
+        logger.warning(f"Could not queue {task.name}, sending inline for {BROKER_RETRY_INTERVAL}s: {str(e)}")
+        return False
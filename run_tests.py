@@ -7,17 +7,29 @@ import os
 import sys
 import subprocess
 import argparse
+import importlib.util
 from pathlib import Path
 
-def run_command(command, description):
-    """Run a command and return success status"""
+TEST_DEPENDENCIES = {'pytest': 'pytest', 'pytest_cov': 'pytest-cov', 'pytest_mock': 'pytest-mock', 'xdist': 'pytest-xdist',
+                     'freezegun': 'freezegun'}
+
+def run_command(command, description, capture=True):
+    """Run a command and return success status (capture=False streams output live)"""
     print(f"\n{'='*60}")
     print(f"Running: {description}")
-    print(f"Command: {command}")
+    print(f"Command: {' '.join(command)}")
     print('='*60)
     
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        # argv list, executed directly without an intermediate shell
+        env = {**os.environ, 'PIP_DISABLE_PIP_VERSION_CHECK': '1'}
+        if not capture:
+            # The child writes straight to our stdout/stderr, so nothing is buffered here
+            sys.stdout.flush()
+            result = subprocess.run(command, env=env)
+            print("✅ SUCCESS" if result.returncode == 0 else "❌ FAILED")
+            return result.returncode == 0
+        result = subprocess.run(command, check=True, capture_output=True, text=True, env=env)
         print("✅ SUCCESS")
         if result.stdout:
             print("Output:", result.stdout)
@@ -26,6 +38,11 @@ def run_command(command, description):
         print("❌ FAILED")
         print("Error:", e.stderr)
         return False
+    except OSError as e:
+        # Without a shell, a missing executable surfaces here instead of as exit code 127
+        print("❌ FAILED")
+        print("Error:", e)
+        return False
 
 def main():
     parser = argparse.ArgumentParser(description='Run tests for Alumni Event Scheduler')
@@ -34,6 +51,7 @@ def main():
     parser.add_argument('--unit', action='store_true', help='Run only unit tests')
     parser.add_argument('--integration', action='store_true', help='Run only integration tests')
     parser.add_argument('--e2e', action='store_true', help='Run only end-to-end tests')
+    parser.add_argument('--slow', action='store_true', help='Include tests marked slow')
     
     args = parser.parse_args()
     
@@ -49,40 +67,48 @@ def main():
         print("⚠️  Warning: Virtual environment not detected")
         print("   Consider activating your virtual environment first")
     
-    # Install test dependencies
-    if not run_command("pip install pytest pytest-cov pytest-mock", "Installing test dependencies"):
-        print("❌ Failed to install test dependencies")
-        return 1
+    # Install test dependencies only when some are missing
+    missing = [package for module, package in TEST_DEPENDENCIES.items() if importlib.util.find_spec(module) is None]
+    if missing:
+        if not run_command([sys.executable, "-m", "pip", "install", *missing], "Installing test dependencies"):
+            print("❌ Failed to install test dependencies")
+            return 1
+    else:
+        print("✅ Test dependencies already installed")
     
     # Run linting
     print("\n🔍 Running code quality checks...")
-    if not run_command("python -m flake8 . --count --select=E9,F63,F7,F82 --show-source --statistics", "Running flake8 linting"):
+    if not run_command([sys.executable, "-m", "flake8", ".", "--count", "--select=E9,F63,F7,F82", "--show-source", "--statistics"], "Running flake8 linting"):
         print("⚠️  Linting issues found, but continuing with tests")
     
     # Run tests
     test_commands = []
+    # -n auto: pytest-xdist runs the tests across one worker per CPU core
+    pytest_cmd = [sys.executable, "-m", "pytest", "-n", "auto"]
+    if not args.slow:
+        pytest_cmd += ["-m", "not slow"]
     
     if args.unit or not any([args.integration, args.e2e]):
-        test_commands.append(("python -m pytest test_api.py -v", "Unit Tests"))
+        test_commands.append(([*pytest_cmd, "test_api.py", "-v"], "Unit Tests"))
     
     if args.integration or not any([args.unit, args.e2e]):
-        test_commands.append(("python -m pytest tests/integration/ -v", "Integration Tests"))
+        test_commands.append(([*pytest_cmd, "tests/integration/", "-v"], "Integration Tests"))
     
     if args.e2e or not any([args.unit, args.integration]):
-        test_commands.append(("python -m pytest tests/e2e/ -v", "End-to-End Tests"))
+        test_commands.append(([*pytest_cmd, "tests/e2e/", "-v"], "End-to-End Tests"))
     
     if not test_commands:
-        test_commands.append(("python -m pytest test_api.py -v", "All Tests"))
+        test_commands.append(([*pytest_cmd, "test_api.py", "-v"], "All Tests"))
     
     # Add coverage if requested
     if args.coverage:
         for i, (cmd, desc) in enumerate(test_commands):
-            test_commands[i] = (f"{cmd} --cov=. --cov-report=html --cov-report=term", desc)
+            test_commands[i] = ([*cmd, "--cov=.", "--cov-report=html", "--cov-report=term"], desc)
     
     # Run all test commands
     all_passed = True
     for command, description in test_commands:
-        if not run_command(command, description):
+        if not run_command(command, description, capture=False):
             all_passed = False
     
     # Generate coverage report
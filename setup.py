@@ -14,12 +14,18 @@ def run_command(command, description):
     """Run a command and handle errors."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        # argv list, executed directly without an intermediate shell
+        env = {**os.environ, 'PIP_DISABLE_PIP_VERSION_CHECK': '1'}
+        result = subprocess.run(command, check=True, capture_output=True, text=True, env=env)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed: {e.stderr}")
         return False
+    except OSError as e:
+        # Without a shell, a missing executable surfaces here instead of as exit code 127
+        print(f"❌ {description} failed: {e}")
+        return False
 
 def check_python_version():
     """Check if Python version is compatible."""
@@ -36,7 +42,7 @@ def create_virtual_environment():
         print("📁 Virtual environment already exists")
         return True
     
-    return run_command("python -m venv venv", "Creating virtual environment")
+    return run_command([sys.executable, "-m", "venv", "venv"], "Creating virtual environment")
 
 def install_dependencies():
     """Install Python dependencies."""
@@ -45,7 +51,7 @@ def install_dependencies():
     else:  # Unix/Linux/MacOS
         pip_cmd = "venv/bin/pip"
     
-    return run_command(f"{pip_cmd} install -r requirements.txt", "Installing dependencies")
+    return run_command([pip_cmd, "install", "-r", "requirements.txt"], "Installing dependencies")
 
 def create_directories():
     """Create necessary directories."""
@@ -125,7 +131,7 @@ def create_sample_data():
     try:
         from pymongo import MongoClient
         from datetime import datetime, timedelta
-        import hashlib
+        from werkzeug.security import generate_password_hash
         
         client = MongoClient("mongodb://localhost:27017")
         db = client["alumni_db"]
@@ -133,7 +139,8 @@ def create_sample_data():
         # Create sample admin user
         admin_user = {
             "email": "admin@alumni-scheduler.com",
-            "password": hashlib.pbkdf2_hmac('sha256', b'admin123', b'salt', 100000).hex(),
+            # Same salted format the app verifies with check_password_hash; scrypt runs in OpenSSL
+            "password": generate_password_hash("admin123", method="scrypt"),
             "name": "Admin User",
             "grad_year": 2020,
             "phone": "+1234567890",
@@ -150,7 +157,7 @@ def create_sample_data():
         }
         
         # Insert admin user if not exists
-        if not db.users.find_one({"email": "admin@alumni-scheduler.com"}):
+        if not db.users.find_one({"email": "admin@alumni-scheduler.com"}, {"_id": 1}):
             db.users.insert_one(admin_user)
             print("✅ Created sample admin user (email: admin@alumni-scheduler.com, password: admin123)")
         
@@ -170,7 +177,7 @@ def create_sample_data():
                 },
                 "tags": ["networking", "social", "professional"],
                 "attachments": [],
-                "created_by": db.users.find_one({"email": "admin@alumni-scheduler.com"})["_id"],
+                "created_by": db.users.find_one({"email": "admin@alumni-scheduler.com"}, {"_id": 1})["_id"],
                 "created_at": datetime.now(),
                 "is_published": True,
                 "rsvp_count": 0
@@ -189,7 +196,7 @@ def create_sample_data():
                 },
                 "tags": ["sports", "homecoming", "tailgate"],
                 "attachments": [],
-                "created_by": db.users.find_one({"email": "admin@alumni-scheduler.com"})["_id"],
+                "created_by": db.users.find_one({"email": "admin@alumni-scheduler.com"}, {"_id": 1})["_id"],
                 "created_at": datetime.now(),
                 "is_published": True,
                 "rsvp_count": 0
@@ -3,18 +3,184 @@
 Simple test for email functionality without Flask app context
 """
 
+import queue
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email import policy
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
 
-def test_smtp_connection():
-    """Test SMTP connection for email functionality"""
+# Email configuration: the same server, port and STARTTLS setting the app sends with (Gmail by default)
+SMTP_SERVER = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
+SMTP_PORT = int(os.getenv('MAIL_PORT', 587))
+SMTP_USE_TLS = os.getenv('MAIL_USE_TLS', 'True').lower() == 'true'
+MAX_MESSAGES_PER_CONNECTION = 1000
+SMTP_POOL_SIZE = 8
+
+TEST_SUBJECT = "Test Email - Alumni Event Scheduler"
+TEST_BODY = """
+        <h2>🎉 Email Test Successful!</h2>
+        <p>This is a test email from the Alumni Event Scheduler system.</p>
+        <p>If you receive this email, the email notification system is working correctly!</p>
+        <p><strong>Features tested:</strong></p>
+        <ul>
+            <li>✅ SMTP connection</li>
+            <li>✅ Email authentication</li>
+            <li>✅ HTML email sending</li>
+        </ul>
+        <p>Best regards,<br>Alumni Event Scheduler System</p>
+        """
+
+def _render_wire():
+    """Serialize the test message once; From/To are prepended per send"""
+    msg = MIMEMultipart()
+    msg['Subject'] = TEST_SUBJECT
+    msg.attach(MIMEText(TEST_BODY, 'html'))
+    return msg.as_bytes(policy=policy.SMTP)
+
+_WIRE = _render_wire()
+
+def wire_message(sender, recipient):
+    """Return the cached message bytes addressed from sender to recipient"""
+    return f"From: {sender}\r\nTo: {recipient}\r\n".encode() + _WIRE
+
+_SMTP_SINGLETON = None
+_smtp_sent = 0
+_smtp_lock = threading.Lock()
+
+# Authenticated connections for batch sends, with messages sent on each
+_smtp_pool = queue.Queue()
+_pool_sent = {}
+_pool_stop = threading.Event()
+
+def open_smtp(username, password):
+    """Open a logged-in SMTP connection"""
+    server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+    try:
+        if SMTP_USE_TLS:
+            server.starttls()  # Enable TLS encryption
+        server.login(username, password)
+    except (smtplib.SMTPException, OSError):
+        server.close()
+        raise
+    return server
+
+def get_smtp(username, password):
+    """Return the shared SMTP connection, reconnecting if it dropped or hit the per-connection cap"""
+    global _SMTP_SINGLETON, _smtp_sent
+    with _smtp_lock:
+        if _SMTP_SINGLETON is not None:
+            try:
+                if _smtp_sent >= MAX_MESSAGES_PER_CONNECTION:
+                    _SMTP_SINGLETON.quit()
+                    _SMTP_SINGLETON = None
+                elif _SMTP_SINGLETON.noop()[0] != 250:
+                    _SMTP_SINGLETON = None
+            except smtplib.SMTPException:
+                _SMTP_SINGLETON = None
+        if _SMTP_SINGLETON is None:
+            _SMTP_SINGLETON = open_smtp(username, password)
+            _smtp_sent = 0
+        return _SMTP_SINGLETON
+
+def send_one(server, sender, recipient):
+    """Send the cached test message on an open connection, leaving it open for the next"""
+    global _smtp_sent
+    server.sendmail(sender, [recipient], wire_message(sender, recipient))
+    with _smtp_lock:
+        _smtp_sent += 1
+
+def fill_smtp_pool(username, password, size=SMTP_POOL_SIZE):
+    """Open logged-in connections until the batch pool holds size of them"""
+    for _ in range(size - _smtp_pool.qsize()):
+        conn = open_smtp(username, password)
+        _pool_sent[conn] = 0
+        _smtp_pool.put(conn)
+
+def _reopen(conn, username, password):
+    """Close conn (if any) and return a fresh logged-in connection; raises if reconnecting fails"""
+    if conn is not None:
+        _pool_sent.pop(conn, None)
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+    conn = open_smtp(username, password)
+    _pool_sent[conn] = 0
+    return conn
+
+def send_pooled(username, password, recipient):
+    """Send the test message to recipient on a pooled connection, retrying once on a fresh one"""
+    # A slot holds a live connection, or None when its connection is gone
+    conn = _smtp_pool.get()
+    error = None
+    try:
+        for _ in range(2):
+            if _pool_stop.is_set():
+                print(f"❌ Skipped {recipient}: batch stopped after an SMTP reconnect failure")
+                return False
+            # Rotate connections that dropped or reached the per-connection cap
+            if conn is None or _pool_sent[conn] >= MAX_MESSAGES_PER_CONNECTION:
+                # Leave the slot empty until the new connection is up, in case reconnecting fails
+                stale, conn = conn, None
+                conn = _reopen(stale, username, password)
+            try:
+                conn.sendmail(username, [recipient], wire_message(username, recipient))
+                _pool_sent[conn] += 1
+                return True
+            except (smtplib.SMTPServerDisconnected, OSError) as e:
+                error = e
+                _pool_sent[conn] = MAX_MESSAGES_PER_CONNECTION
+            except smtplib.SMTPException as e:
+                print(f"❌ Failed to send to {recipient}: {e}")
+                return False
+        print(f"❌ Failed to send to {recipient} after reconnecting: {error}")
+        return False
+    except (smtplib.SMTPException, OSError) as e:
+        # Reconnect failed: stop the remaining sends instead of hammering the server
+        _pool_stop.set()
+        print(f"❌ Failed to send to {recipient}: could not reconnect ({e}); stopping the batch")
+        return False
+    finally:
+        # Always give the slot back so no worker blocks on an empty pool
+        _smtp_pool.put(conn)
+
+def send_batch(username, password, recipients, pool_size=SMTP_POOL_SIZE):
+    """Send the test message to many recipients in parallel; returns the number delivered"""
+    _pool_stop.clear()
+    fill_smtp_pool(username, password, pool_size)
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        results = executor.map(lambda recipient: send_pooled(username, password, recipient), recipients)
+        return sum(results)
+
+def close_smtp():
+    """Close the shared SMTP connection and any pooled batch connections"""
+    global _SMTP_SINGLETON
+    with _smtp_lock:
+        if _SMTP_SINGLETON is not None:
+            try:
+                _SMTP_SINGLETON.quit()
+            except smtplib.SMTPException:
+                pass
+            _SMTP_SINGLETON = None
+    while not _smtp_pool.empty():
+        conn = _smtp_pool.get_nowait()
+        if conn is None:
+            continue
+        _pool_sent.pop(conn, None)
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+
+def test_smtp_connection(server=None):
+    """Test SMTP connection for email functionality (reuses server when given, else opens and closes one)"""
     print("🧪 Testing Email SMTP Connection...")
     
-    # Email configuration (using Gmail as example)
-    smtp_server = "smtp.gmail.com"
-    smtp_port = 587
+    smtp_server = SMTP_SERVER
+    smtp_port = SMTP_PORT
     
     # Check if email credentials are set
     email_username = os.getenv('MAIL_USERNAME', '')
@@ -28,43 +194,20 @@ def test_smtp_connection():
     print(f"📧 Testing connection to {smtp_server}:{smtp_port}")
     print(f"📧 Username: {email_username}")
     
+    opened = server is None
     try:
-        # Create SMTP connection
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()  # Enable TLS encryption
-        server.login(email_username, email_password)
+        # Reuse an open connection instead of paying TLS + AUTH again
+        if opened:
+            server = get_smtp(email_username, email_password)
         
         print("✅ SMTP connection successful!")
         
-        # Test sending a simple email
-        msg = MIMEMultipart()
-        msg['From'] = email_username
-        msg['To'] = email_username  # Send to self for testing
-        msg['Subject'] = "Test Email - Alumni Event Scheduler"
-        
-        body = """
-        <h2>🎉 Email Test Successful!</h2>
-        <p>This is a test email from the Alumni Event Scheduler system.</p>
-        <p>If you receive this email, the email notification system is working correctly!</p>
-        <p><strong>Features tested:</strong></p>
-        <ul>
-            <li>✅ SMTP connection</li>
-            <li>✅ Email authentication</li>
-            <li>✅ HTML email sending</li>
-        </ul>
-        <p>Best regards,<br>Alumni Event Scheduler System</p>
-        """
-        
-        msg.attach(MIMEText(body, 'html'))
-        
-        # Send email
-        text = msg.as_string()
-        server.sendmail(email_username, email_username, text)
+        # Send email; the connection stays open for further sends
+        send_one(server, email_username, email_username)  # Send to self for testing
         
         print("✅ Test email sent successfully!")
         print(f"📧 Check your inbox at {email_username}")
         
-        server.quit()
         return True
         
     except smtplib.SMTPAuthenticationError:
@@ -77,6 +220,9 @@ def test_smtp_connection():
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return False
+    finally:
+        if opened:
+            close_smtp()
 
 def check_email_config():
     """Check email configuration"""
@@ -105,6 +251,18 @@ if __name__ == "__main__":
     print("\n" + "=" * 50)
     success = test_smtp_connection()
     
+    # Optional batch check: MAIL_BATCH_RECIPIENTS=a@example.com,b@example.com
+    batch = [r.strip() for r in os.getenv('MAIL_BATCH_RECIPIENTS', '').split(',') if r.strip()]
+    if success and batch:
+        try:
+            delivered = send_batch(os.getenv('MAIL_USERNAME'), os.getenv('MAIL_PASSWORD'), batch)
+            print(f"📧 Batch: {delivered}/{len(batch)} delivered")
+            success = delivered == len(batch)
+        except (smtplib.SMTPException, OSError) as e:
+            print(f"❌ Batch send failed to connect: {e}")
+            success = False
+    close_smtp()
+    
     if success:
         print("\n🎉 Email system is ready!")
         print("   ✅ Event creation emails will be sent to selected alumni")
@@ -3,25 +3,60 @@
 Startup and test script for Alumni Scheduler
 """
 
+import asyncio
 import subprocess
 import time
 import sys
 import os
+import signal
 import threading
+import socket
 import requests
+from importlib.util import find_spec
 from urllib.parse import urljoin
 
+# Wire compression for seed writes; zlib is always available, zstd/snappy only when installed
+_COMPRESSORS = ",".join(
+    [name for name, module in (("zstd", "zstandard"), ("snappy", "snappy")) if find_spec(module)] + ["zlib"]
+)
+
+_CLIENT = None
+
+def _db():
+    """Return the alumni database from one MongoClient shared by the whole process"""
+    global _CLIENT
+    if _CLIENT is None:
+        from pymongo import MongoClient
+        _CLIENT = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"),
+                              maxPoolSize=10, serverSelectionTimeoutMS=2000,
+                              compressors=_COMPRESSORS, zlibCompressionLevel=-1)
+    return _CLIENT["alumni_db"]
+
+def wait_for_port(host, port, timeout=10.0, interval=0.05):
+    """Return True once host:port accepts TCP connections, False after timeout"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), interval).close()
+            return True
+        except OSError:
+            time.sleep(interval)
+    return False
+
 def start_flask_app():
     """Start the Flask application in background"""
     try:
         print("🚀 Starting Flask application...")
-        # Start Flask app in background
+        # Start Flask app in background; nobody reads its output, so a PIPE would eventually stall it
         process = subprocess.Popen([
             sys.executable, "app.py"
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         
-        # Wait a moment for the app to start
-        time.sleep(3)
+        # Poll until the port accepts connections instead of sleeping a fixed time
+        if not wait_for_port("localhost", 5000, timeout=10.0):
+            print("❌ Flask app did not open port 5000 within 10 seconds")
+            process.terminate()
+            return None
         
         # Check if app is running
         try:
@@ -40,56 +75,62 @@ def start_flask_app():
         print(f"❌ Error starting Flask app: {e}")
         return None
 
-def run_tests():
-    """Run the navbar and login tests"""
+async def run_tests(timeout=30):
+    """Run the navbar and login tests, streaming their output as it is produced"""
     print("\n🧪 Running tests...")
     try:
-        result = subprocess.run([
-            sys.executable, "test_navbar_login.py"
-        ], capture_output=True, text=True, timeout=30)
-        
-        print(result.stdout)
-        if result.stderr:
-            print("Errors:", result.stderr)
-            
-        return result.returncode == 0
-    except subprocess.TimeoutExpired:
-        print("❌ Tests timed out")
-        return False
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "test_navbar_login.py",
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+        )
     except Exception as e:
         print(f"❌ Error running tests: {e}")
         return False
+    
+    async def stream():
+        async for line in proc.stdout:
+            print(line.decode(errors="replace"), end="")
+        return await proc.wait()
+    
+    try:
+        return await asyncio.wait_for(stream(), timeout) == 0
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        print("❌ Tests timed out")
+        return False
 
 def create_test_users():
     """Create test users for testing"""
     print("\n👥 Creating test users...")
     
     try:
-        from pymongo import MongoClient
+        from pymongo import UpdateOne
+        from pymongo.errors import OperationFailure
         from werkzeug.security import generate_password_hash
-        from datetime import datetime
-        import os
+        from datetime import datetime, timezone
         from dotenv import load_dotenv
         
         load_dotenv()
         
         # Connect to MongoDB
-        client = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))
-        db = client["alumni_db"]
+        db = _db()
         users_collection = db["users"]
         
+        # One timezone-aware timestamp for every seeded document (utcnow is deprecated)
+        now = datetime.now(timezone.utc)
+        
         # Test alumni user
         alumni_user = {
             "name": "Test Alumni",
             "email": "alumni@test.com",
-            "password": generate_password_hash("password123"),
             "is_admin": False,
             "is_active": True,
             "phone": "+1234567890",
             "grad_year": 2020,
             "profile_picture": "",
             "preferences": {"email": True, "sms": False, "push": True},
-            "created_at": datetime.utcnow(),
+            "created_at": now,
             "last_login": None,
             "failed_login_attempts": 0,
             "lockout_until": None,
@@ -104,14 +145,13 @@ def create_test_users():
         admin_user = {
             "name": "Test Admin",
             "email": "admin@test.com", 
-            "password": generate_password_hash("admin123"),
             "is_admin": True,
             "is_active": True,
             "phone": "+1234567890",
             "grad_year": 2018,
             "profile_picture": "",
             "preferences": {"email": True, "sms": False, "push": True},
-            "created_at": datetime.utcnow(),
+            "created_at": now,
             "last_login": None,
             "failed_login_attempts": 0,
             "lockout_until": None,
@@ -122,18 +162,34 @@ def create_test_users():
             "profile_privacy": "alumni_only"
         }
         
-        # Insert users if they don't exist
-        if not users_collection.find_one({"email": "alumni@test.com"}):
-            users_collection.insert_one(alumni_user)
-            print("✅ Created test alumni user: alumni@test.com / password123")
-        else:
-            print("ℹ️  Test alumni user already exists")
-            
-        if not users_collection.find_one({"email": "admin@test.com"}):
-            users_collection.insert_one(admin_user)
-            print("✅ Created test admin user: admin@test.com / admin123")
-        else:
-            print("ℹ️  Test admin user already exists")
+        # Unique email index keeps the upsert lookup indexed
+        try:
+            users_collection.create_index("email", unique=True)
+        except OperationFailure as e:
+            print(f"⚠️  Could not create unique email index: {e}")
+        
+        # Insert users if they don't exist; only new users pay for the password hash
+        seed_users = [
+            (alumni_user, "password123", "✅ Created test alumni user: alumni@test.com / password123", "ℹ️  Test alumni user already exists"),
+            (admin_user, "admin123", "✅ Created test admin user: admin@test.com / admin123", "ℹ️  Test admin user already exists")
+        ]
+        existing = {user["email"] for user in users_collection.find(
+            {"email": {"$in": [user["email"] for user, _, _, _ in seed_users]}}, {"email": 1, "_id": 0}
+        )}
+        missing = [seed for seed in seed_users if seed[0]["email"] not in existing]
+        for user, password, _, _ in missing:
+            user["password"] = generate_password_hash(password)
+        
+        created = set()
+        if missing:
+            result = users_collection.bulk_write([
+                UpdateOne({"email": user["email"]}, {"$setOnInsert": user}, upsert=True)
+                for user, _, _, _ in missing
+            ], ordered=False)
+            created = {missing[index][0]["email"] for index in result.upserted_ids}
+        
+        for user, _, created_message, existing_message in seed_users:
+            print(created_message if user["email"] in created else existing_message)
             
         return True
         
@@ -186,7 +242,7 @@ def main():
     
     try:
         # Run tests
-        tests_passed = run_tests()
+        tests_passed = asyncio.run(run_tests())
         
         if tests_passed:
             print("✅ All tests passed!")
@@ -200,13 +256,20 @@ def main():
         print(f"\n🌐 Flask app is running at: http://localhost:5000")
         print("Press Ctrl+C to stop the server...")
         
-        try:
-            flask_process.wait()
-        except KeyboardInterrupt:
+        def stop_flask(signum, frame):
             print("\n🛑 Stopping Flask app...")
             flask_process.terminate()
+        
+        # Wait in the kernel; Ctrl+C terminates the child and waitpid returns once it exits
+        signal.signal(signal.SIGINT, stop_flask)
+        if os.name == "nt":
             flask_process.wait()
-            print("✅ Flask app stopped.")
+        else:
+            try:
+                os.waitpid(flask_process.pid, 0)
+            except ChildProcessError:
+                pass
+        print("✅ Flask app stopped.")
             
     except Exception as e:
         print(f"❌ Error during testing: {e}")
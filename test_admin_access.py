@@ -3,9 +3,17 @@
 Test admin access to various routes
 """
 
-import requests
 import sys
 
+from fix_utils import probe_routes
+
+STATUS_LABELS = {
+    200: "✅ OK",
+    302: "🔄 Redirect (may need login)",
+    403: "❌ Forbidden",
+    404: "❌ Not Found"
+}
+
 def test_admin_access():
     """Test admin access to routes"""
     base_url = "http://localhost:5000"
@@ -31,26 +39,15 @@ def test_admin_access():
     print("Test credentials: admin@alumni-event-scheduler.com / admin123")
     print()
     
-    for route in admin_routes:
-        try:
-            url = f"{base_url}{route}"
-            response = requests.get(url, timeout=5, allow_redirects=False)
-            
-            if response.status_code == 200:
-                status = "✅ OK"
-            elif response.status_code == 302:
-                status = "🔄 Redirect (may need login)"
-            elif response.status_code == 403:
-                status = "❌ Forbidden"
-            elif response.status_code == 404:
-                status = "❌ Not Found"
-            else:
-                status = f"⚠️  {response.status_code}"
-                
-            print(f"{route:<20} {status}")
-            
-        except requests.exceptions.RequestException as e:
-            print(f"{route:<20} ❌ Connection Error")
+    # Probe every route at once; rows are written out in one go
+    rows = []
+    for route, response in probe_routes(base_url, admin_routes):
+        if response is None:
+            rows.append(f"{route:<20} ❌ Connection Error\n")
+        else:
+            status = STATUS_LABELS.get(response.status, f"⚠️  {response.status}")
+            rows.append(f"{route:<20} {status}\n")
+    sys.stdout.write("".join(rows))
     
     print()
     print("Manual Testing Steps:")
@@ -3,9 +3,25 @@
 Test admin profile functionality
 """
 
-import requests
 import sys
-from urllib.parse import urljoin
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from fix_utils import probe_routes
+
+STATUS_LABELS = {
+    200: "✅ Accessible",
+    403: "❌ Forbidden (permission issue)",
+    404: "❌ Not Found"
+}
+
+LOGIN_PATHS = ("/login", "/admin/login")
+
+# 302 labels, keyed by whether the redirect goes to a login page
+REDIRECT_LABELS = {
+    True: "🔄 Redirects to login (need to login first)",
+    False: "🔄 Redirects (may be normal)"
+}
 
 def test_admin_profile_access():
     """Test admin profile access"""
@@ -30,31 +46,22 @@ def test_admin_profile_access():
     print("Credentials: admin@alumni-event-scheduler.com / admin123")
     print()
     
-    for route, description in profile_routes:
-        try:
-            url = urljoin(base_url, route)
-            response = requests.get(url, timeout=5, allow_redirects=False)
-            
-            if response.status_code == 200:
-                status = "✅ Accessible"
-            elif response.status_code == 302:
-                # Check if redirecting to login
-                location = response.headers.get('Location', '')
-                if 'login' in location:
-                    status = "🔄 Redirects to login (need to login first)"
-                else:
-                    status = "🔄 Redirects (may be normal)"
-            elif response.status_code == 403:
-                status = "❌ Forbidden (permission issue)"
-            elif response.status_code == 404:
-                status = "❌ Not Found"
-            else:
-                status = f"⚠️  Status {response.status_code}"
-                
-            print(f"{description:<20} {status}")
-            
-        except requests.exceptions.RequestException as e:
-            print(f"{description:<20} ❌ Connection Error")
+    # Probe every route at once; rows are written out in one go
+    descriptions = dict(profile_routes)
+    rows = []
+    for route, response in probe_routes(base_url, descriptions):
+        description = descriptions[route]
+        if response is None:
+            rows.append(f"{description:<20} ❌ Connection Error\n")
+        elif response.status == 302:
+            # Check if redirecting to login
+            location = response.getheader('Location', '')
+            login_redirect = urlsplit(location).path.startswith(LOGIN_PATHS)
+            rows.append(f"{description:<20} {REDIRECT_LABELS[login_redirect]}\n")
+        else:
+            status = STATUS_LABELS.get(response.status, f"⚠️  Status {response.status}")
+            rows.append(f"{description:<20} {status}\n")
+    sys.stdout.write("".join(rows))
     
     print("\n" + "=" * 40)
     print("Manual Testing Steps:")
@@ -83,16 +90,25 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+_CLIENT = None
+
+def _db():
+    """Return the alumni database from one MongoClient shared by the whole process"""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"),
+                              maxPoolSize=10, serverSelectionTimeoutMS=2000)
+    return _CLIENT["alumni_db"]
+
 def update_admin_profile():
     """Update admin user with complete profile data"""
     try:
         # MongoDB connection
-        client = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))
-        db = client["alumni_db"]
+        db = _db()
         users_collection = db["users"]
         
         # Find admin user
-        admin_user = users_collection.find_one({"email": "admin@alumni-event-scheduler.com"})
+        admin_user = users_collection.find_one({"email": "admin@alumni-event-scheduler.com"}, {"_id": 1})
         
         if admin_user:
             # Update admin profile with complete data
@@ -145,10 +161,14 @@ if __name__ == "__main__":
     print("✅ Complete!")
 '''
     
-    with open("update_admin_profile.py", "w", encoding="utf-8") as f:
-        f.write(test_script)
-    
-    print("✅ Created update_admin_profile.py")
+    # Only touch the file when its content actually changes
+    script_path = Path("update_admin_profile.py")
+    new_content = test_script.encode("utf-8")
+    if script_path.exists() and script_path.read_bytes() == new_content:
+        print("✅ update_admin_profile.py is up to date")
+    else:
+        script_path.write_bytes(new_content)
+        print("✅ Created update_admin_profile.py")
 
 def main():
     """Run all tests and fixes"""
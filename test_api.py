@@ -2,384 +2,400 @@
 """
 Comprehensive test suite for Alumni Event Scheduler API
 """
-import os
+import asyncio
 import sys
-import json
-import unittest
+from collections import ChainMap
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import create_autospec, patch, MagicMock
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import pytest
+from freezegun import freeze_time
+from jinja2 import Environment
+from werkzeug.security import generate_password_hash
 
-from api import create_api_app
-from config import TestingConfig
-from models import UserModel, EventModel, RSVPModel
+from models import UserModel, EventModel, RSVPModel, UPCOMING_EVENT_PROJECTION
+from notifications import NotificationTemplate
 
-class TestAlumniEventSchedulerAPI(unittest.TestCase):
+@pytest.fixture(scope="module")
+def now():
+    """One timestamp shared by every test in the module"""
+    return datetime.utcnow().replace(microsecond=0)
+
+@pytest.fixture(scope="module", autouse=True)
+def _freeze(now):
+    """Freeze the clock at now so API-side timestamps match"""
+    with freeze_time(now):
+        yield
+
+@pytest.fixture(scope="session")
+def hashed_pw():
+    """Hash the test password once; the KDF is deliberately slow"""
+    return generate_password_hash('TestPassword123!')
+
+@pytest.fixture
+def user(hashed_pw, now):
+    """Mock user data"""
+    return {
+        '_id': '507f1f77bcf86cd799439011',
+        'name': 'Test User',
+        'email': 'test@example.com',
+        'password_hash': hashed_pw,
+        'role': 'alumni',
+        'phone': '+1234567890',
+        'preferences': {'email': True, 'sms': False, 'push': True},
+        'created_at': now,
+        'is_active': True
+    }
+
+@pytest.fixture
+def event(now):
+    """Mock event data"""
+    return {
+        '_id': '507f1f77bcf86cd799439012',
+        'title': 'Test Event',
+        'description': 'Test event description',
+        'start_time': now + timedelta(days=7),
+        'end_time': now + timedelta(days=7, hours=2),
+        'venue': 'Test Venue',
+        'capacity': 50,
+        'timezone': 'UTC',
+        'created_by': '507f1f77bcf86cd799439011',
+        'created_at': now
+    }
+
+USER_ID = '507f1f77bcf86cd799439011'
+
+MODEL_NAMES = ('user_model', 'event_model', 'rsvp_model')
+
+@pytest.fixture(scope="session")
+def model_mock_factory():
+    """Look up the API's model classes once; each call returns a fresh autospec'd mock"""
+    import api
+    model_classes = {name: type(getattr(api, name)) for name in MODEL_NAMES}
+    return lambda name: create_autospec(model_classes[name], instance=True)
+
+@pytest.fixture
+def api_mocks(mocker, model_mock_factory):
+    """Patch the API's model singletons in one go with spec'd mocks"""
+    mocks = {name: model_mock_factory(name) for name in MODEL_NAMES}
+    mocker.patch.multiple('api', **mocks)
+    return mocks
+
+@pytest.fixture
+def logged_in(mocker):
+    """Authenticate requests as the test user"""
+    return mocker.patch('api.get_current_user', return_value=USER_ID)
+
+@pytest.fixture
+def as_admin(mocker):
+    """Let requests through the admin check"""
+    return mocker.patch('api.require_admin', return_value=None)
+
+class TestAlumniEventSchedulerAPI:
     """Test cases for the Alumni Event Scheduler API"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.app = create_api_app(TestingConfig)
-        self.app.config['TESTING'] = True
-        self.client = self.app.test_client()
-        
-        # Mock database
-        self.mock_db = MagicMock()
-        self.mock_users = MagicMock()
-        self.mock_events = MagicMock()
-        self.mock_rsvps = MagicMock()
-        
-        # Mock collections
-        self.mock_db.users = self.mock_users
-        self.mock_db.events = self.mock_events
-        self.mock_db.rsvps = self.mock_rsvps
-        
-        # Mock user data
-        self.test_user = {
-            '_id': '507f1f77bcf86cd799439011',
-            'name': 'Test User',
-            'email': 'test@example.com',
-            'password_hash': 'hashed_password',
-            'role': 'alumni',
-            'phone': '+1234567890',
-            'preferences': {'email': True, 'sms': False, 'push': True},
-            'created_at': datetime.utcnow(),
-            'is_active': True
-        }
+    def test_health_check(self, client):
+        """Test health check endpoint"""
+        response = client.get('/api/health')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert 'status' in data
+        assert data['status'] == 'healthy'
+    
+    @pytest.mark.parametrize('payload, existing, expected_status, expected_keys', [
+        ({'name': 'Test User', 'email': 'test@example.com', 'password': 'TestPassword123!',
+          'phone': '+1234567890', 'role': 'alumni'}, False, 201, ('access_token', 'refresh_token', 'user')),
+        ({'name': 'Test User', 'email': 'test@example.com', 'password': 'TestPassword123!'},
+         True, 409, ('message',)),
+        ({'name': 'Test User', 'email': 'test@example.com', 'password': 'weak'},
+         False, 400, ('errors',))
+    ], ids=['success', 'duplicate_email', 'weak_password'])
+    def test_user_registration(self, client, api_mocks, user, payload, existing, expected_status, expected_keys):
+        """Test user registration outcomes"""
+        api_mocks['user_model'].get_user_by_email.return_value = user if existing else None
+        api_mocks['user_model'].validate_user_data.return_value = []
+        api_mocks['user_model'].create_user.return_value = user
         
-        # Mock event data
-        self.test_event = {
-            '_id': '507f1f77bcf86cd799439012',
-            'title': 'Test Event',
-            'description': 'Test event description',
-            'start_time': datetime.utcnow() + timedelta(days=7),
-            'end_time': datetime.utcnow() + timedelta(days=7, hours=2),
-            'venue': 'Test Venue',
-            'capacity': 50,
-            'timezone': 'UTC',
-            'created_by': '507f1f77bcf86cd799439011',
-            'created_at': datetime.utcnow()
-        }
+        response = client.post('/api/auth/register', json=payload)
+        
+        assert response.status_code == expected_status
+        data = response.get_json()
+        for key in expected_keys:
+            assert key in data
     
-    def test_health_check(self):
-        """Test health check endpoint"""
-        response = self.client.get('/api/health')
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
-        self.assertIn('status', data)
-        self.assertEqual(data['status'], 'healthy')
-    
-    def test_user_registration_success(self):
-        """Test successful user registration"""
-        with patch('api.user_model') as mock_user_model:
-            mock_user_model.get_user_by_email.return_value = None
-            mock_user_model.validate_user_data.return_value = []
-            mock_user_model.create_user.return_value = self.test_user
-            
-            response = self.client.post('/api/auth/register', json={
-                'name': 'Test User',
-                'email': 'test@example.com',
-                'password': 'TestPassword123!',
-                'phone': '+1234567890',
-                'role': 'alumni'
-            })
-            
-            self.assertEqual(response.status_code, 201)
-            data = json.loads(response.data)
-            self.assertIn('access_token', data)
-            self.assertIn('refresh_token', data)
-            self.assertIn('user', data)
-    
-    def test_user_registration_duplicate_email(self):
-        """Test user registration with duplicate email"""
-        with patch('api.user_model') as mock_user_model:
-            mock_user_model.get_user_by_email.return_value = self.test_user
-            
-            response = self.client.post('/api/auth/register', json={
-                'name': 'Test User',
-                'email': 'test@example.com',
-                'password': 'TestPassword123!'
-            })
-            
-            self.assertEqual(response.status_code, 409)
-            data = json.loads(response.data)
-            self.assertIn('message', data)
-    
-    def test_user_registration_weak_password(self):
-        """Test user registration with weak password"""
-        response = self.client.post('/api/auth/register', json={
-            'name': 'Test User',
+    def test_user_login_success(self, client, api_mocks, mocker, user):
+        """Test successful user login"""
+        api_mocks['user_model'].get_user_by_email.return_value = user
+        api_mocks['user_model'].update_user.return_value = True
+        mocker.patch('api.check_password_hash', return_value=True)
+        
+        response = client.post('/api/auth/login', json={
             'email': 'test@example.com',
-            'password': 'weak'
+            'password': 'TestPassword123!'
         })
         
-        self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
-        self.assertIn('errors', data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert 'access_token' in data
+        assert 'refresh_token' in data
+        assert 'user' in data
     
-    def test_user_login_success(self):
-        """Test successful user login"""
-        with patch('api.user_model') as mock_user_model:
-            mock_user_model.get_user_by_email.return_value = self.test_user
-            mock_user_model.update_user.return_value = True
-            
-            with patch('api.check_password_hash', return_value=True):
-                response = self.client.post('/api/auth/login', json={
-                    'email': 'test@example.com',
-                    'password': 'TestPassword123!'
-                })
-                
-                self.assertEqual(response.status_code, 200)
-                data = json.loads(response.data)
-                self.assertIn('access_token', data)
-                self.assertIn('refresh_token', data)
-                self.assertIn('user', data)
-    
-    def test_user_login_invalid_credentials(self):
+    def test_user_login_invalid_credentials(self, client, api_mocks):
         """Test login with invalid credentials"""
-        with patch('api.user_model') as mock_user_model:
-            mock_user_model.get_user_by_email.return_value = None
-            
-            response = self.client.post('/api/auth/login', json={
-                'email': 'test@example.com',
-                'password': 'wrongpassword'
-            })
-            
-            self.assertEqual(response.status_code, 401)
-            data = json.loads(response.data)
-            self.assertIn('message', data)
+        api_mocks['user_model'].get_user_by_email.return_value = None
+        
+        response = client.post('/api/auth/login', json={
+            'email': 'test@example.com',
+            'password': 'wrongpassword'
+        })
+        
+        assert response.status_code == 401
+        data = response.get_json()
+        assert 'message' in data
     
-    def test_get_user_profile(self):
+    @pytest.mark.usefixtures('logged_in')
+    def test_get_user_profile(self, client, api_mocks, user):
         """Test getting user profile"""
-        with patch('api.user_model') as mock_user_model:
-            mock_user_model.get_user_by_id.return_value = self.test_user
-            
-            with patch('api.get_current_user', return_value='507f1f77bcf86cd799439011'):
-                response = self.client.get('/api/users/me')
-                
-                self.assertEqual(response.status_code, 200)
-                data = json.loads(response.data)
-                self.assertEqual(data['name'], 'Test User')
-                self.assertEqual(data['email'], 'test@example.com')
-    
-    def test_update_user_profile(self):
+        api_mocks['user_model'].get_user_by_id.return_value = user
+        
+        response = client.get('/api/users/me')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['name'] == 'Test User'
+        assert data['email'] == 'test@example.com'
+    
+    @pytest.mark.usefixtures('logged_in')
+    def test_update_user_profile(self, client, api_mocks, user):
         """Test updating user profile"""
-        with patch('api.user_model') as mock_user_model:
-            mock_user_model.get_user_by_id.return_value = self.test_user
-            mock_user_model.update_user.return_value = True
-            
-            with patch('api.get_current_user', return_value='507f1f77bcf86cd799439011'):
-                response = self.client.put('/api/users/me', json={
-                    'name': 'Updated Name',
-                    'phone': '+0987654321'
-                })
-                
-                self.assertEqual(response.status_code, 200)
-                data = json.loads(response.data)
-                self.assertIn('message', data)
-    
-    def test_get_events_list(self):
+        api_mocks['user_model'].get_user_by_id.return_value = user
+        api_mocks['user_model'].update_user.return_value = True
+        
+        response = client.put('/api/users/me', json={
+            'name': 'Updated Name',
+            'phone': '+0987654321'
+        })
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert 'message' in data
+    
+    def test_get_events_list(self, client, api_mocks, event):
         """Test getting events list"""
-        with patch('api.event_model') as mock_event_model:
-            mock_event_model.search_events.return_value = {
-                'events': [self.test_event],
-                'total': 1,
-                'page': 1,
-                'per_page': 10,
-                'pages': 1
-            }
-            
-            response = self.client.get('/api/events')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('events', data)
-            self.assertEqual(len(data['events']), 1)
-    
-    def test_create_event_success(self):
+        api_mocks['event_model'].search_events.return_value = {
+            'events': [event],
+            'total': 1,
+            'page': 1,
+            'per_page': 10,
+            'pages': 1
+        }
+        
+        response = client.get('/api/events')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert 'events' in data
+        assert len(data['events']) == 1
+    
+    @pytest.mark.usefixtures('logged_in', 'as_admin')
+    def test_create_event_success(self, client, api_mocks, user, event, now):
         """Test successful event creation"""
-        with patch('api.user_model') as mock_user_model:
-            mock_user_model.get_user_by_id.return_value = self.test_user
-            
-            with patch('api.event_model') as mock_event_model:
-                mock_event_model.validate_event_data.return_value = []
-                mock_event_model.create_event.return_value = self.test_event
-                
-                with patch('api.require_admin', return_value=None):
-                    with patch('api.get_current_user', return_value='507f1f77bcf86cd799439011'):
-                        response = self.client.post('/api/events', json={
-                            'title': 'Test Event',
-                            'description': 'Test event description',
-                            'start_time': (datetime.utcnow() + timedelta(days=7)).isoformat(),
-                            'end_time': (datetime.utcnow() + timedelta(days=7, hours=2)).isoformat(),
-                            'venue': 'Test Venue',
-                            'capacity': 50,
-                            'timezone': 'UTC'
-                        })
-                        
-                        self.assertEqual(response.status_code, 201)
-                        data = json.loads(response.data)
-                        self.assertEqual(data['title'], 'Test Event')
-    
-    def test_create_event_validation_error(self):
+        api_mocks['user_model'].get_user_by_id.return_value = user
+        api_mocks['event_model'].validate_event_data.return_value = []
+        api_mocks['event_model'].create_event.return_value = event
+        
+        response = client.post('/api/events', json={
+            'title': 'Test Event',
+            'description': 'Test event description',
+            'start_time': (now + timedelta(days=7)).isoformat(),
+            'end_time': (now + timedelta(days=7, hours=2)).isoformat(),
+            'venue': 'Test Venue',
+            'capacity': 50,
+            'timezone': 'UTC'
+        })
+        
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data['title'] == 'Test Event'
+    
+    @pytest.mark.usefixtures('logged_in', 'as_admin')
+    def test_create_event_validation_error(self, client, api_mocks, now):
         """Test event creation with validation error"""
-        with patch('api.event_model') as mock_event_model:
-            mock_event_model.validate_event_data.return_value = ['Invalid start time']
-            
-            with patch('api.require_admin', return_value=None):
-                with patch('api.get_current_user', return_value='507f1f77bcf86cd799439011'):
-                    response = self.client.post('/api/events', json={
-                        'title': 'Test Event',
-                        'description': 'Test event description',
-                        'start_time': 'invalid-date',
-                        'end_time': (datetime.utcnow() + timedelta(days=7, hours=2)).isoformat(),
-                        'venue': 'Test Venue',
-                        'capacity': 50
-                    })
-                    
-                    self.assertEqual(response.status_code, 400)
-                    data = json.loads(response.data)
-                    self.assertIn('errors', data)
-    
-    def test_get_event_detail(self):
+        api_mocks['event_model'].validate_event_data.return_value = ['Invalid start time']
+        
+        response = client.post('/api/events', json={
+            'title': 'Test Event',
+            'description': 'Test event description',
+            'start_time': 'invalid-date',
+            'end_time': (now + timedelta(days=7, hours=2)).isoformat(),
+            'venue': 'Test Venue',
+            'capacity': 50
+        })
+        
+        assert response.status_code == 400
+        data = response.get_json()
+        assert 'errors' in data
+    
+    def test_get_event_detail(self, client, api_mocks, event):
         """Test getting event detail"""
-        with patch('api.event_model') as mock_event_model:
-            mock_event_model.get_event_by_id.return_value = self.test_event
-            
-            response = self.client.get('/api/events/507f1f77bcf86cd799439012')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertEqual(data['title'], 'Test Event')
-    
-    def test_get_event_not_found(self):
+        api_mocks['event_model'].get_event_by_id.return_value = event
+        
+        response = client.get('/api/events/507f1f77bcf86cd799439012')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['title'] == 'Test Event'
+    
+    def test_get_event_not_found(self, client, api_mocks):
         """Test getting non-existent event"""
-        with patch('api.event_model') as mock_event_model:
-            mock_event_model.get_event_by_id.return_value = None
-            
-            response = self.client.get('/api/events/507f1f77bcf86cd799439012')
-            
-            self.assertEqual(response.status_code, 404)
-            data = json.loads(response.data)
-            self.assertIn('message', data)
-    
-    def test_create_rsvp_success(self):
+        api_mocks['event_model'].get_event_by_id.return_value = None
+        
+        response = client.get('/api/events/507f1f77bcf86cd799439012')
+        
+        assert response.status_code == 404
+        data = response.get_json()
+        assert 'message' in data
+    
+    @pytest.mark.usefixtures('logged_in')
+    def test_create_rsvp_success(self, client, api_mocks, event, now):
         """Test successful RSVP creation"""
-        with patch('api.event_model') as mock_event_model:
-            mock_event_model.get_event_by_id.return_value = self.test_event
-            
-            with patch('api.rsvp_model') as mock_rsvp_model:
-                mock_rsvp_model.get_rsvp_by_event_and_user.return_value = None
-                mock_rsvp_model.create_rsvp.return_value = {
-                    '_id': '507f1f77bcf86cd799439013',
-                    'event_id': '507f1f77bcf86cd799439012',
-                    'user_id': '507f1f77bcf86cd799439011',
-                    'status': 'going',
-                    'guests': 1,
-                    'notes': '',
-                    'created_at': datetime.utcnow()
-                }
-                
-                with patch('api.get_current_user', return_value='507f1f77bcf86cd799439011'):
-                    response = self.client.post('/api/events/507f1f77bcf86cd799439012/rsvp', json={
-                        'status': 'going',
-                        'guests': 1,
-                        'notes': 'Looking forward to it!'
-                    })
-                    
-                    self.assertEqual(response.status_code, 200)
-                    data = json.loads(response.data)
-                    self.assertIn('message', data)
-                    self.assertEqual(data['status'], 'going')
-    
-    def test_create_rsvp_invalid_status(self):
+        api_mocks['event_model'].get_event_by_id.return_value = event
+        api_mocks['rsvp_model'].get_rsvp_by_event_and_user.return_value = None
+        api_mocks['rsvp_model'].create_rsvp.return_value = {
+            '_id': '507f1f77bcf86cd799439013',
+            'event_id': '507f1f77bcf86cd799439012',
+            'user_id': USER_ID,
+            'status': 'going',
+            'guests': 1,
+            'notes': '',
+            'created_at': now
+        }
+        
+        response = client.post('/api/events/507f1f77bcf86cd799439012/rsvp', json={
+            'status': 'going',
+            'guests': 1,
+            'notes': 'Looking forward to it!'
+        })
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert 'message' in data
+        assert data['status'] == 'going'
+    
+    @pytest.mark.usefixtures('logged_in')
+    def test_create_rsvp_invalid_status(self, client, api_mocks, event):
         """Test RSVP creation with invalid status"""
-        with patch('api.event_model') as mock_event_model:
-            mock_event_model.get_event_by_id.return_value = self.test_event
-            
-            with patch('api.get_current_user', return_value='507f1f77bcf86cd799439011'):
-                response = self.client.post('/api/events/507f1f77bcf86cd799439012/rsvp', json={
-                    'status': 'invalid_status',
-                    'guests': 1
-                })
-                
-                self.assertEqual(response.status_code, 400)
-                data = json.loads(response.data)
-                self.assertIn('message', data)
-    
-    def test_get_rsvp_stats(self):
+        api_mocks['event_model'].get_event_by_id.return_value = event
+        
+        response = client.post('/api/events/507f1f77bcf86cd799439012/rsvp', json={
+            'status': 'invalid_status',
+            'guests': 1
+        })
+        
+        assert response.status_code == 400
+        data = response.get_json()
+        assert 'message' in data
+    
+    def test_get_rsvp_stats(self, client, api_mocks):
         """Test getting RSVP statistics"""
-        with patch('api.rsvp_model') as mock_rsvp_model:
-            mock_rsvp_model.get_rsvp_stats.return_value = {
-                'going': 10,
-                'maybe': 5,
-                'not_going': 2,
-                'waitlist': 0,
-                'total_guests': 15
-            }
-            
-            response = self.client.get('/api/events/507f1f77bcf86cd799439012/rsvp-stats')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertEqual(data['going'], 10)
-            self.assertEqual(data['maybe'], 5)
-            self.assertEqual(data['total_guests'], 15)
-    
-    def test_rate_limiting(self):
+        api_mocks['rsvp_model'].get_rsvp_stats.return_value = {
+            'going': 10,
+            'maybe': 5,
+            'not_going': 2,
+            'waitlist': 0,
+            'total_guests': 15
+        }
+        
+        response = client.get('/api/events/507f1f77bcf86cd799439012/rsvp-stats')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['going'] == 10
+        assert data['maybe'] == 5
+        assert data['total_guests'] == 15
+    
+    def test_rate_limiting(self, client):
         """Test rate limiting on auth endpoints"""
         # This would require more complex setup with actual rate limiting
         # For now, we'll just test that the endpoint exists
-        response = self.client.post('/api/auth/login', json={
+        response = client.post('/api/auth/login', json={
             'email': 'test@example.com',
             'password': 'TestPassword123!'
         })
         
         # Should return 401 for invalid credentials, not rate limit error
-        self.assertIn(response.status_code, [401, 429])
+        assert response.status_code in [401, 429]
     
-    def test_cors_headers(self):
+    def test_cors_headers(self, client):
         """Test CORS headers are present"""
-        response = self.client.options('/api/events')
-        self.assertIn('Access-Control-Allow-Origin', response.headers)
+        response = client.options('/api/events')
+        assert 'Access-Control-Allow-Origin' in response.headers
     
-    def test_jwt_token_required(self):
+    def test_jwt_token_required(self, client):
         """Test that protected endpoints require JWT token"""
-        response = self.client.get('/api/users/me')
-        self.assertEqual(response.status_code, 401)
+        response = client.get('/api/users/me')
+        assert response.status_code == 401
     
-    def test_admin_required(self):
+    @pytest.mark.usefixtures('logged_in')
+    def test_admin_required(self, client, api_mocks, user, now):
         """Test that admin endpoints require admin role"""
-        with patch('api.get_current_user', return_value='507f1f77bcf86cd799439011'):
-            with patch('api.user_model') as mock_user_model:
-                mock_user_model.get_user_by_id.return_value = {
-                    **self.test_user,
-                    'role': 'alumni'  # Not admin
-                }
-                
-                response = self.client.post('/api/events', json={
-                    'title': 'Test Event',
-                    'description': 'Test event description',
-                    'start_time': (datetime.utcnow() + timedelta(days=7)).isoformat(),
-                    'end_time': (datetime.utcnow() + timedelta(days=7, hours=2)).isoformat(),
-                    'venue': 'Test Venue',
-                    'capacity': 50
-                })
-                
-                self.assertEqual(response.status_code, 403)
-                data = json.loads(response.data)
-                self.assertIn('message', data)
+        api_mocks['user_model'].get_user_by_id.return_value = {
+            **user,
+            'role': 'alumni'  # Not admin
+        }
+        
+        response = client.post('/api/events', json={
+            'title': 'Test Event',
+            'description': 'Test event description',
+            'start_time': (now + timedelta(days=7)).isoformat(),
+            'end_time': (now + timedelta(days=7, hours=2)).isoformat(),
+            'venue': 'Test Venue',
+            'capacity': 50
+        })
+        
+        assert response.status_code == 403
+        data = response.get_json()
+        assert 'message' in data
+
+# Shared event variables for the notification templates
+EVENT_VARS = {
+    'event_title': 'Test Event',
+    'start_time': '2024-01-01 10:00 AM',
+    'venue': 'Test Venue',
+    'description': 'Annual meetup',
+    'rsvp_link': 'http://localhost:3000/events/1#rsvp'
+}
+
+@pytest.fixture
+def notify_config():
+    """TestingConfig with SendGrid and push switched on"""
+    from config import TestingConfig
+    return type('NotifyTestingConfig', (TestingConfig,), {
+        'SENDGRID_API_KEY': 'SG.test',
+        'MAIL_USERNAME': 'alumni@example.com',
+        'ENABLE_EMAIL_NOTIFICATIONS': True,
+        'ENABLE_PUSH_NOTIFICATIONS': True
+    })
+
+@pytest.fixture
+def manager(notify_config, mocker):
+    """NotificationManager whose SendGrid session and FCM client are mocks; nothing leaves the process"""
+    from notifications import NotificationManager
+    manager = NotificationManager(notify_config)
+    manager.email_service.http_session = MagicMock()
+    manager.email_service.http_session.post.return_value = MagicMock(status_code=202)
+    manager.push_service.fcm_available = True
+    mocker.patch('notifications.messaging', create=True)
+    return manager
+
+def _sendgrid_payloads(manager):
+    """The JSON bodies posted to SendGrid, in order"""
+    return [call.kwargs['json'] for call in manager.email_service.http_session.post.call_args_list]
 
-class TestNotificationSystem(unittest.TestCase):
+@pytest.mark.usefixtures("app")
+class TestNotificationSystem:
     """Test cases for the notification system"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.app = create_api_app(TestingConfig)
-        self.app.config['TESTING'] = True
-    
     def test_notification_template_rendering(self):
         """Test notification template rendering"""
         from notifications import NotificationTemplate
@@ -393,8 +409,8 @@ class TestNotificationSystem(unittest.TestCase):
         }
         
         subject = template_handler.render_template('event_created', 'subject', variables)
-        self.assertIn('Test Event', subject)
-        self.assertIn('New Alumni Event', subject)
+        assert 'Test Event' in subject
+        assert 'New Alumni Event' in subject
     
     def test_email_notification_service(self):
         """Test email notification service"""
@@ -411,71 +427,280 @@ class TestNotificationSystem(unittest.TestCase):
                 'start_time': '2024-01-01 10:00 AM',
                 'venue': 'Test Venue'
             })
-            self.assertTrue(result)
+            assert result
+    
+    @pytest.mark.parametrize("limit, value, batch_sizes", [
+        ('SENDGRID_MAX_PERSONALIZATIONS', 2, [2, 2, 1]),
+        ('SENDGRID_MAX_PAYLOAD_BYTES', 0, [1, 1, 1, 1, 1]),
+    ], ids=["personalizations", "payload"])
+    def test_bulk_email_splits_batches(self, manager, mocker, limit, value, batch_sizes):
+        """Test bulk email starts a new SendGrid request at either limit"""
+        mocker.patch(f'notifications.{limit}', value)
+        recipients = [(f'user{i}@example.com', {'user_name': f'User {i}'}) for i in range(5)]
+        
+        results = manager.email_service.send_bulk_template_email(recipients, 'event_created', EVENT_VARS)
+        
+        assert results == {email: True for email, _ in recipients}
+        assert [len(payload['personalizations']) for payload in _sendgrid_payloads(manager)] == batch_sizes
+    
+    def test_bulk_email_substitutes_per_user_keys(self, manager):
+        """Test per-user values travel as -key- substitutions on one shared body"""
+        recipients = [
+            ('ann@example.com', {'user_name': 'Ann'}),
+            ('bob@example.com', {'user_name': 'Bob', 'user_email': 'bob@example.com'})
+        ]
+        
+        manager.email_service.send_bulk_template_email(recipients, 'event_created', EVENT_VARS)
+        
+        (payload,) = _sendgrid_payloads(manager)
+        substitutions = {p['to'][0]['email']: p['substitutions'] for p in payload['personalizations']}
+        assert substitutions == {
+            'ann@example.com': {'-user_name-': 'Ann', '-user_email-': ''},
+            'bob@example.com': {'-user_name-': 'Bob', '-user_email-': 'bob@example.com'}
+        }
+        html = next(part['value'] for part in payload['content'] if part['type'] == 'text/html')
+        assert 'Hello -user_name-,' in html and 'Test Event' in html
+    
+    def test_bulk_notification_reports_failed_batch(self, manager, mocker):
+        """Test a failed SendGrid batch marks only its recipients as failed"""
+        mocker.patch('notifications.SENDGRID_MAX_PERSONALIZATIONS', 2)
+        manager.email_service.http_session.post.side_effect = [MagicMock(status_code=202), MagicMock(status_code=500)]
+        users = [{'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(3)]
+        users.append({'name': 'Opted Out', 'email': 'out@example.com', 'preferences': {'email': False}})
+        failed_users = []
+        
+        results = manager.send_bulk_notification(users, 'event_created', EVENT_VARS, failed_users=failed_users)
+        
+        assert results == {'success': 2, 'failed': 2, 'skipped': 0}
+        # The opted-out user is not retried
+        assert failed_users == [(users[2], ['email'])]
+    
+    def test_async_bulk_notification_matches_sync(self, manager, mocker):
+        """Test the async bulk path batches email and reports failures like the sync one"""
+        mocker.patch('notifications.SENDGRID_MAX_PERSONALIZATIONS', 2)
+        manager.email_service.http_session.post.side_effect = [MagicMock(status_code=202), MagicMock(status_code=500)]
+        users = [{'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(3)]
+        failed_users = []
+        
+        results = asyncio.run(manager.async_send_bulk_notification(users, 'event_created', EVENT_VARS,
+                                                                   failed_users=failed_users))
+        
+        assert results == {'success': 2, 'failed': 1, 'skipped': 0}
+        assert len(_sendgrid_payloads(manager)) == 2
+        assert failed_users == [(users[2], ['email'])]
+    
+    def test_bulk_push_batches_tokens(self, manager, mocker):
+        """Test push tokens go out in FCM batches and map back to their users"""
+        import notifications
+        mocker.patch('notifications.FCM_MAX_BATCH', 2)
+        sent, rejected = MagicMock(success=True), MagicMock(success=False)
+        notifications.messaging.send_multicast.side_effect = [
+            MagicMock(responses=[rejected, sent]),
+            MagicMock(responses=[rejected])
+        ]
+        users = [
+            {'email': 'a@example.com', 'device_tokens': ['a1', 'a2']},
+            {'email': 'b@example.com', 'device_tokens': ['b1']},
+            {'email': 'c@example.com'}
+        ]
+        failed_users = []
+        
+        results = manager.send_bulk_notification(users, 'event_created', EVENT_VARS, ['push'], failed_users)
+        
+        batches = [call.kwargs['tokens'] for call in notifications.messaging.MulticastMessage.call_args_list]
+        assert batches == [['a1', 'a2'], ['b1']]
+        assert results == {'success': 1, 'failed': 2, 'skipped': 0}
+        assert failed_users == [(users[1], ['push'])]
+    
+    def test_send_notification_sends_inline_by_default(self, manager, mocker):
+        """Test send_notification returns per-channel results unless queuing is asked for"""
+        task = mocker.patch('celery_app.send_notification_task')
+        
+        results = manager.send_notification({'name': 'Ann', 'email': 'ann@example.com'}, 'test', 'event_created', EVENT_VARS)
+        
+        assert results == {'email': True}
+        task.delay.assert_not_called()
+    
+    def test_send_notification_queues_task_only_fields(self, manager, mocker):
+        """Test queue=True hands the JSON-safe user fields to the worker"""
+        task = mocker.patch('celery_app.send_notification_task')
+        mocker.patch('notifications._broker_down_until', 0.0)
+        user = {'_id': USER_ID, 'name': 'Ann', 'email': 'ann@example.com', 'password': 'hash'}
+        
+        results = manager.send_notification(user, 'test', 'event_created', EVENT_VARS, queue=True)
+        
+        assert results == {'queued': True}
+        task.delay.assert_called_once_with({'name': 'Ann', 'email': 'ann@example.com'}, 'event_created', EVENT_VARS, ['email'])
+        manager.email_service.http_session.post.assert_not_called()
+    
+    def test_send_notification_sends_inline_when_broker_down(self, manager, mocker):
+        """Test a refused enqueue falls back to sending inline and skips the broker for a while"""
+        task = mocker.patch('celery_app.send_notification_task')
+        task.delay.side_effect = ConnectionError("broker unreachable")
+        mocker.patch('notifications._broker_down_until', 0.0)
+        user = {'name': 'Ann', 'email': 'ann@example.com'}
+        
+        first = manager.send_notification(user, 'test', 'event_created', EVENT_VARS, queue=True)
+        second = manager.send_notification(user, 'test', 'event_created', EVENT_VARS, queue=True)
+        
+        assert first == second == {'email': True}
+        # The second call does not wait on the broker again
+        task.delay.assert_called_once()
 
-class TestModels(unittest.TestCase):
+# Every (template, part) pair the handler knows about
+TEMPLATE_PARTS = [(name, part) for name, parts in NotificationTemplate().sources.items() for part in parts]
+
+# Every variable the templates read, with braces to catch format-string escaping slips
+SHARED_VARS = {
+    **EVENT_VARS,
+    'venue': 'Hall {A}',
+    'status': 'going',
+    'guests': 2,
+    'notes': '',
+    'time_until': '1 days, 2 hours',
+    'event_link': 'http://localhost:3000/events/1',
+    'cancellation_reason': 'Venue closed'
+}
+
+# (shared variables, per-user variables for successive recipients)
+LAYERED_CASES = {
+    'all_set': (SHARED_VARS, [
+        {'user_name': 'Ann', 'user_email': 'ann@example.com'},
+        {'user_name': 'Curly {name}', 'user_email': ''}
+    ]),
+    'missing': ({'event_title': 'Test Event', 'guests': 0}, [{'user_name': 'Ann'}, {}]),
+    'per_user_in_if': ({k: v for k, v in SHARED_VARS.items() if k not in ('guests', 'notes')}, [
+        {'user_name': 'Ann', 'guests': 1, 'notes': 'Bring a badge'},
+        {'user_name': 'Bob', 'guests': 0, 'notes': ''}
+    ]),
+    'shared_shadows_user': (dict(SHARED_VARS, user_name='Everyone'), [{'user_name': 'Ann', 'user_email': 'ann@example.com'}])
+}
+
+class TestTemplateRendering:
+    """Layered rendering must match a plain per-user Jinja render"""
+    
+    @pytest.mark.parametrize("template_name, template_type", TEMPLATE_PARTS)
+    @pytest.mark.parametrize("shared, per_user_vars", LAYERED_CASES.values(), ids=list(LAYERED_CASES))
+    def test_layered_render_matches_jinja(self, template_name, template_type, shared, per_user_vars):
+        """Test render_template(ChainMap(shared, per_user)) against Jinja with the merged variables"""
+        handler = NotificationTemplate()
+        reference = Environment().from_string(handler.sources[template_name][template_type])
+        
+        # Successive recipients reuse the memoized partial for the shared part
+        for per_user in per_user_vars:
+            rendered = handler.render_template(template_name, template_type, ChainMap(shared, per_user))
+            assert rendered == reference.render(**{**per_user, **shared})
+
+@pytest.fixture(scope="module")
+def validating_user_model():
+    """UserModel for validation-only tests; validation never touches the collection"""
+    return UserModel(MagicMock())
+
+class TestModels:
     """Test cases for data models"""
     
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def setup(self):
         """Set up test fixtures"""
         self.mock_collection = MagicMock()
         self.user_model = UserModel(self.mock_collection)
     
-    def test_user_validation(self):
+    @pytest.mark.parametrize('user_data, expected_error', [
+        ({'name': 'Test User', 'email': 'test@example.com',
+          'password_hash': 'hashed_password', 'role': 'alumni'}, None),
+        ({'name': 'Test User', 'email': 'invalid-email',
+          'password_hash': 'hashed_password', 'role': 'alumni'}, 'Invalid email format'),
+        ({'name': 'Test User', 'email': 'test@example.com',
+          'password_hash': 'hashed_password', 'role': 'invalid_role'}, 'Role must be')
+    ], ids=['valid', 'invalid_email', 'invalid_role'])
+    def test_user_validation(self, validating_user_model, user_data, expected_error):
         """Test user data validation"""
-        valid_user = {
-            'name': 'Test User',
-            'email': 'test@example.com',
-            'password_hash': 'hashed_password',
-            'role': 'alumni'
-        }
+        errors = validating_user_model.validate_user_data(user_data)
+        if expected_error is None:
+            assert len(errors) == 0
+        else:
+            assert len(errors) > 0
+            assert expected_error in errors[0]
+    
+    def test_create_users_bulk(self):
+        """Test bulk user creation uses a single insert_many"""
+        self.mock_collection.insert_many.return_value.inserted_ids = ['id1', 'id2']
+        
+        users = self.user_model.create_users([
+            {'name': 'User One', 'email': 'one@example.com'},
+            {'name': 'User Two', 'email': 'two@example.com', 'role': 'admin'}
+        ])
         
-        errors = self.user_model.validate_user_data(valid_user)
-        self.assertEqual(len(errors), 0)
+        self.mock_collection.insert_many.assert_called_once()
+        assert [user['_id'] for user in users] == ['id1', 'id2']
+        assert users[0]['role'] == 'alumni'
+        assert users[1]['role'] == 'admin'
+        assert users[0]['created_at'] == users[1]['created_at']
     
-    def test_user_validation_invalid_email(self):
-        """Test user validation with invalid email"""
-        invalid_user = {
-            'name': 'Test User',
-            'email': 'invalid-email',
-            'password_hash': 'hashed_password',
-            'role': 'alumni'
-        }
+    def test_get_user_by_id_cached_until_update(self):
+        """Test user lookups are served from cache and invalidated on update"""
+        user_id = '507f1f77bcf86cd799439011'
+        self.mock_collection.find_one.return_value = {'_id': user_id, 'name': 'Test User'}
+        
+        first = self.user_model.get_user_by_id(user_id)
+        first['name'] = 'Mutated'
+        second = self.user_model.get_user_by_id(user_id)
+        
+        assert self.mock_collection.find_one.call_count == 1
+        assert second['name'] == 'Test User'
         
-        errors = self.user_model.validate_user_data(invalid_user)
-        self.assertGreater(len(errors), 0)
-        self.assertIn('Invalid email format', errors[0])
+        self.mock_collection.update_one.return_value.modified_count = 1
+        self.user_model.update_user(user_id, {'name': 'Renamed'})
+        self.user_model.get_user_by_id(user_id)
+        assert self.mock_collection.find_one.call_count == 2
     
-    def test_user_validation_invalid_role(self):
-        """Test user validation with invalid role"""
-        invalid_user = {
-            'name': 'Test User',
-            'email': 'test@example.com',
-            'password_hash': 'hashed_password',
-            'role': 'invalid_role'
-        }
+    def test_update_user_compares_whole_values(self):
+        """Test the unchanged-document filter compares whole field values, not array elements"""
+        self.mock_collection.update_one.return_value.modified_count = 1
         
-        errors = self.user_model.validate_user_data(invalid_user)
-        self.assertGreater(len(errors), 0)
-        self.assertIn('Role must be', errors[0])
-
-def run_tests():
-    """Run all tests"""
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_suite.addTest(unittest.makeSuite(TestAlumniEventSchedulerAPI))
-    test_suite.addTest(unittest.makeSuite(TestNotificationSystem))
-    test_suite.addTest(unittest.makeSuite(TestModels))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-    
-    # Return success status
-    return result.wasSuccessful()
+        assert self.user_model.update_user(USER_ID, {'skills': 'Python'})
+        
+        changed_filter = self.mock_collection.update_one.call_args[0][0]
+        assert changed_filter['$expr'] == {'$or': [{'$ne': ['$skills', {'$literal': 'Python'}]}]}
+    
+    def test_rsvp_stats_exclude_not_going_guests(self):
+        """Test guest totals ignore RSVPs that are not going"""
+        rsvp_model = RSVPModel(self.mock_collection)
+        self.mock_collection.aggregate.return_value = iter([])
+        
+        stats = rsvp_model.get_rsvp_stats('507f1f77bcf86cd799439012')
+        
+        pipeline = self.mock_collection.aggregate.call_args[0][0]
+        guest_statuses = pipeline[1]['$group']['total_guests']['$sum']['$cond'][0]['$in'][1]
+        assert 'not_going' not in guest_statuses
+        assert stats['total_guests'] == 0
+    
+    def test_create_rsvps_bulk_skips_existing(self):
+        """Test bulk RSVP creation only returns newly upserted RSVPs"""
+        rsvp_model = RSVPModel(self.mock_collection)
+        self.mock_collection.bulk_write.return_value.upserted_ids = {1: 'new_id'}
+        
+        created = rsvp_model.create_rsvps([
+            {'event_id': 'event1', 'user_id': 'user1', 'status': 'going'},
+            {'event_id': 'event1', 'user_id': 'user2', 'status': 'maybe'}
+        ])
+        
+        self.mock_collection.bulk_write.assert_called_once()
+        assert len(created) == 1
+        assert created[0]['user_id'] == 'user2'
+        assert created[0]['_id'] == 'new_id'
+    
+    def test_upcoming_events_keep_full_documents(self):
+        """Test only the summary query is narrowed to the covering projection"""
+        event_model = EventModel(self.mock_collection)
+        
+        event_model.get_upcoming_events()
+        event_model.get_upcoming_event_summaries()
+        
+        full, summaries = self.mock_collection.find.call_args_list
+        assert len(full.args) == 1  # no projection: callers get every field
+        assert summaries.args[1] == UPCOMING_EVENT_PROJECTION
 
 if __name__ == '__main__':
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    # One worker process per CPU core (pytest-xdist)
+    sys.exit(pytest.main(["-n", "auto", __file__]))
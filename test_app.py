@@ -2,218 +2,98 @@
 """
 Test script for Alumni Event Scheduler
 This script tests the basic functionality of the application.
+
+Common issues:
+- MongoDB not running: Start MongoDB service (database tests are skipped until then)
+- Missing dependencies: Run 'pip install -r requirements.txt'
+- Port conflicts: Make sure port 5001 is available for the server startup test
 """
 
-import os
+import importlib.util
 import sys
+import pytest
 import requests
 import time
-import subprocess
 import threading
 from pathlib import Path
+from werkzeug.serving import make_server
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+ROUTES = ['/', '/events', '/login', '/register']
 
 def test_imports():
     """Test if all required modules can be imported."""
-    print("🔄 Testing imports...")
-    try:
-        import flask
-        import pymongo
-        import flask_login
-        import flask_mail
-        import werkzeug
-        from bson.objectid import ObjectId
-        from datetime import datetime
-        print("✅ All imports successful")
-        return True
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
-        return False
+    import flask
+    import pymongo
+    import flask_login
+    import flask_mail
+    import werkzeug
+    from bson.objectid import ObjectId
+    # Only locate the app module; importing it would bootstrap Flask and MongoDB
+    assert importlib.util.find_spec('app') is not None
 
-def test_database_connection():
+def test_database_connection(mongo):
     """Test MongoDB connection."""
-    print("🔄 Testing database connection...")
-    try:
-        from pymongo import MongoClient
-        client = MongoClient("mongodb://localhost:27017", serverSelectionTimeoutMS=5000)
-        client.server_info()
-        print("✅ Database connection successful")
-        return True
-    except Exception as e:
-        print(f"❌ Database connection failed: {e}")
-        return False
+    assert mongo.admin.command('ping')['ok'] == 1
 
-def test_app_creation():
+def test_app_creation(flask_app):
     """Test if the Flask app can be created."""
-    print("🔄 Testing Flask app creation...")
-    try:
-        from app import app
-        print("✅ Flask app created successfully")
-        return True
-    except Exception as e:
-        print(f"❌ Flask app creation failed: {e}")
-        return False
+    assert flask_app is not None
 
-def test_routes():
-    """Test if routes are accessible."""
-    print("🔄 Testing routes...")
-    try:
-        from app import app
-        with app.test_client() as client:
-            # Test homepage
-            response = client.get('/')
-            if response.status_code == 200:
-                print("✅ Homepage route working")
-            else:
-                print(f"❌ Homepage route failed: {response.status_code}")
-                return False
-            
-            # Test events page
-            response = client.get('/events')
-            if response.status_code == 200:
-                print("✅ Events route working")
-            else:
-                print(f"❌ Events route failed: {response.status_code}")
-                return False
-            
-            # Test login page
-            response = client.get('/login')
-            if response.status_code == 200:
-                print("✅ Login route working")
-            else:
-                print(f"❌ Login route failed: {response.status_code}")
-                return False
-            
-            # Test register page
-            response = client.get('/register')
-            if response.status_code == 200:
-                print("✅ Register route working")
-            else:
-                print(f"❌ Register route failed: {response.status_code}")
-                return False
-            
-        return True
-    except Exception as e:
-        print(f"❌ Route testing failed: {e}")
-        return False
+@pytest.fixture
+def client(flask_app):
+    """Test client for the main Flask app"""
+    return flask_app.test_client()
 
-def test_user_registration():
+@pytest.mark.parametrize('path', ROUTES)
+def test_route_ok(client, path):
+    """Test that each public page is accessible."""
+    response = client.get(path)
+    assert response.status_code == 200, f"{path} returned {response.status_code}"
+
+@pytest.mark.usefixtures('mongo')
+def test_user_registration(client):
     """Test user registration functionality."""
-    print("🔄 Testing user registration...")
-    try:
-        from app import app
-        with app.test_client() as client:
-            # Test registration form
-            response = client.post('/register', data={
-                'name': 'Test User',
-                'email': 'test@example.com',
-                'password': 'testpassword123',
-                'grad_year': '2020',
-                'phone': '+1234567890'
-            })
-            
-            if response.status_code == 302:  # Redirect after successful registration
-                print("✅ User registration working")
-                return True
-            else:
-                print(f"❌ User registration failed: {response.status_code}")
-                return False
-    except Exception as e:
-        print(f"❌ User registration testing failed: {e}")
-        return False
+    response = client.post('/register', data={
+        'name': 'Test User',
+        'email': 'test@example.com',
+        'password': 'testpassword123',
+        'grad_year': '2020',
+        'phone': '+1234567890'
+    })
+
+    # Redirect after successful registration
+    assert response.status_code == 302
 
 def test_file_upload():
     """Test file upload functionality."""
-    print("🔄 Testing file upload...")
-    try:
-        # Check if upload directory exists
-        upload_dir = Path("static/uploads")
-        if upload_dir.exists():
-            print("✅ Upload directory exists")
-            return True
-        else:
-            print("❌ Upload directory does not exist")
-            return False
-    except Exception as e:
-        print(f"❌ File upload testing failed: {e}")
-        return False
+    upload_dir = Path(__file__).parent / "static" / "uploads"
+    assert upload_dir.exists(), "Upload directory does not exist"
 
-def run_server_test():
+@pytest.mark.slow
+def test_server_startup(flask_app, http):
     """Test if the server can start."""
-    print("🔄 Testing server startup...")
+    # Start server in a separate thread; make_server lets us shut it down afterwards
+    server = make_server('localhost', 5001, flask_app)
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
     try:
-        from app import app
-        # Start server in a separate thread
-        def run_server():
-            app.run(debug=False, port=5001, use_reloader=False)
-        
-        server_thread = threading.Thread(target=run_server)
-        server_thread.daemon = True
-        server_thread.start()
-        
-        # Wait for server to start
-        time.sleep(3)
-        
-        # Test if server is responding
-        try:
-            response = requests.get('http://localhost:5001', timeout=5)
-            if response.status_code == 200:
-                print("✅ Server started successfully")
-                return True
-            else:
-                print(f"❌ Server responded with status: {response.status_code}")
-                return False
-        except requests.exceptions.RequestException:
-            print("❌ Server not responding")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Server startup failed: {e}")
-        return False
+        # Poll until the server answers instead of sleeping a fixed time
+        response = None
+        deadline = time.monotonic() + 3
+        while response is None and time.monotonic() < deadline:
+            try:
+                response = http.get('http://localhost:5001', timeout=0.2)
+            except requests.exceptions.ConnectionError:
+                time.sleep(0.05)
 
-def main():
-    """Main test function."""
-    print("🧪 Alumni Event Scheduler Test Suite")
-    print("=" * 40)
-    
-    tests = [
-        ("Import Test", test_imports),
-        ("Database Connection", test_database_connection),
-        ("Flask App Creation", test_app_creation),
-        ("Route Testing", test_routes),
-        ("User Registration", test_user_registration),
-        ("File Upload", test_file_upload),
-        ("Server Startup", run_server_test)
-    ]
-    
-    passed = 0
-    total = len(tests)
-    
-    for test_name, test_func in tests:
-        print(f"\n📋 Running {test_name}...")
-        if test_func():
-            passed += 1
-        else:
-            print(f"❌ {test_name} failed")
-    
-    print(f"\n📊 Test Results: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("🎉 All tests passed! The application is ready to use.")
-        print("\nTo start the application:")
-        print("python app.py")
-        print("\nThen open your browser to: http://localhost:5000")
-    else:
-        print("⚠️  Some tests failed. Please check the errors above.")
-        print("\nCommon issues:")
-        print("- MongoDB not running: Start MongoDB service")
-        print("- Missing dependencies: Run 'pip install -r requirements.txt'")
-        print("- Port conflicts: Make sure port 5000 is available")
-    
-    return passed == total
+        assert response is not None, "Server not responding"
+        assert response.status_code == 200
+    finally:
+        server.shutdown()
+        server.server_close()
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    # Same default as run_tests.py: the server startup test is opt-in (pytest -m slow test_app.py)
+    sys.exit(pytest.main(["-n", "auto", "-m", "not slow", __file__]))
@@ -9,34 +9,79 @@ import sys
 import os
 from unittest.mock import patch, MagicMock
 import json
+import pytest
+import re
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app import app, users_collection, events_collection, rsvps_collection
 from bson import ObjectId
+from werkzeug.security import generate_password_hash
 from datetime import datetime
 
-class TestEnhancedAuthentication(unittest.TestCase):
-    """Test cases for enhanced authentication system"""
+TEST_PASSWORDS = ('SecurePass123!', 'AdminPass123!', 'UserPass123!', 'OldPass123!', 'SessionPass123!')
+
+# Accounts the integration tests create or look up; other suites may leave some of them behind
+TEST_EMAILS = ('test@example.com', 'admin@example.com', 'regular@example.com',
+               'reset@example.com', 'nonexistent@example.com', 'session@example.com')
+
+# Text each enhanced page must render, with one compiled alternation per page
+UI_PAGE_MARKERS = {
+    path: (frozenset(needles), re.compile(b'|'.join(re.escape(n) for n in needles)))
+    for path, needles in {
+        '/login': (b'Welcome Back', b'password strength', b'Remember me'),
+        '/register': (b'Join Our Alumni Community', b'Password strength', b'Terms of Service'),
+        '/admin/login': (b'Admin Portal', b'Security Notice', b'Restricted Access'),
+        '/forgot-password': (b'Reset Your Password', b'What happens next'),
+    }.items()
+}
+
+# Collection methods that take a session and are allowed inside a transaction
+SESSION_METHODS = frozenset([
+    'find', 'find_one', 'insert_one', 'insert_many', 'update_one', 'update_many',
+    'replace_one', 'delete_one', 'delete_many', 'count_documents', 'aggregate',
+    'distinct', 'bulk_write', 'find_one_and_update', 'find_one_and_delete', 'find_one_and_replace'
+])
+
+class SessionCollection:
+    """Collection proxy that runs every data operation inside the test's transaction"""
+    
+    def __init__(self, collection, session):
+        self._collection = collection
+        self._session = session
+    
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if name not in SESSION_METHODS:
+            return attr
+        def call(*args, **kwargs):
+            kwargs.setdefault('session', self._session)
+            return attr(*args, **kwargs)
+        return call
+
+class TestAuthValidation(unittest.TestCase):
+    """Validation paths that never need a database; every collection is mocked"""
     
     def setUp(self):
-        """Set up test environment"""
+        """Set up the test client and mock the app's collections"""
         self.app = app
         self.app.config['TESTING'] = True
         self.app.config['WTF_CSRF_ENABLED'] = False
         self.client = self.app.test_client()
         
-        # Clear test data
-        users_collection.delete_many({})
-        events_collection.delete_many({})
-        rsvps_collection.delete_many({})
-    
-    def tearDown(self):
-        """Clean up after tests"""
-        users_collection.delete_many({})
-        events_collection.delete_many({})
-        rsvps_collection.delete_many({})
+        # No existing users, and inserts hand back a real id
+        self.users = MagicMock()
+        self.users.find_one.return_value = None
+        self.users.count_documents.return_value = 1
+        self.users.insert_one.return_value.inserted_id = ObjectId()
+        for name, collection in [('users_collection', self.users),
+                                 ('events_collection', MagicMock()),
+                                 ('rsvps_collection', MagicMock()),
+                                 ('user_activity_collection', MagicMock())]:
+            patcher = patch(f'app.{name}', collection)
+            patcher.start()
+            self.addCleanup(patcher.stop)
     
     def test_enhanced_registration_validation(self):
         """Test enhanced registration validation"""
@@ -55,6 +100,8 @@ class TestEnhancedAuthentication(unittest.TestCase):
         
         self.assertEqual(response.status_code, 302)  # Redirect after successful registration
         self.assertIn(b'Welcome to our alumni community', response.data)
+        self.assertEqual(self.users.insert_one.call_args[0][0]['email'], 'john@example.com')
+        self.users.insert_one.reset_mock()
         
         # Test 2: Password mismatch
         response = self.client.post('/register', data={
@@ -69,6 +116,7 @@ class TestEnhancedAuthentication(unittest.TestCase):
         
         self.assertEqual(response.status_code, 302)
         self.assertIn(b'Passwords do not match', response.data)
+        self.users.insert_one.assert_not_called()
         
         # Test 3: Weak password
         response = self.client.post('/register', data={
@@ -83,6 +131,7 @@ class TestEnhancedAuthentication(unittest.TestCase):
         
         self.assertEqual(response.status_code, 302)
         self.assertIn(b'Password must be at least 8 characters long', response.data)
+        self.users.insert_one.assert_not_called()
         
         # Test 4: Invalid email
         response = self.client.post('/register', data={
@@ -97,6 +146,7 @@ class TestEnhancedAuthentication(unittest.TestCase):
         
         self.assertEqual(response.status_code, 302)
         self.assertIn(b'Please enter a valid email address', response.data)
+        self.users.insert_one.assert_not_called()
         
         # Test 5: Terms not accepted
         response = self.client.post('/register', data={
@@ -110,9 +160,104 @@ class TestEnhancedAuthentication(unittest.TestCase):
         
         self.assertEqual(response.status_code, 302)
         self.assertIn(b'You must accept the Terms of Service', response.data)
+        self.users.insert_one.assert_not_called()
         
         print("✅ Enhanced registration validation tests passed!")
     
+    def test_ui_enhancements(self):
+        """Test UI enhancements are properly rendered"""
+        print("\n🧪 Testing UI Enhancements...")
+        
+        for path, (needles, pattern) in UI_PAGE_MARKERS.items():
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            # One regex pass over the body instead of an assertIn scan per marker
+            missing = needles - set(pattern.findall(response.data))
+            self.assertFalse(missing, f"{path} is missing {sorted(missing)}")
+        
+        print("✅ UI enhancements tests passed!")
+    
+    def test_security_features(self):
+        """Test security enhancements"""
+        print("\n🧪 Testing Security Features...")
+        
+        # Test 1: SQL injection protection
+        malicious_input = "'; DROP TABLE users; --"
+        response = self.client.post('/login', data={
+            'email': malicious_input,
+            'password': 'test'
+        })
+        
+        # Should not crash and should handle gracefully
+        self.assertEqual(response.status_code, 200)
+        
+        # Test 2: XSS protection
+        xss_input = "<script>alert('xss')</script>"
+        response = self.client.post('/register', data={
+            'name': xss_input,
+            'email': 'xss@example.com',
+            'grad_year': '2020',
+            'password': 'SecurePass123!',
+            'confirm_password': 'SecurePass123!',
+            'terms': 'on'
+        })
+        
+        # Should escape the input
+        self.assertEqual(response.status_code, 302)
+        
+        print("✅ Security features tests passed!")
+
+@pytest.mark.slow
+class TestAuthIntegration(unittest.TestCase):
+    """Login flows against the real database"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Hash the test passwords and check whether the server supports transactions"""
+        # Hash every test password once; each hash is deliberately slow
+        cls.HASHED = {password: generate_password_hash(password) for password in TEST_PASSWORDS}
+        
+        hello = users_collection.database.client.admin.command('hello')
+        cls.use_transactions = 'setName' in hello or hello.get('msg') == 'isdbgrid'
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.app = app
+        self.app.config['TESTING'] = True
+        self.app.config['WTF_CSRF_ENABLED'] = False
+        self.client = self.app.test_client()
+        
+        if self.use_transactions:
+            # Every write goes into a transaction that tearDown aborts, so nothing needs deleting
+            self.session = users_collection.database.client.start_session()
+            self.session.start_transaction()
+            self.users_collection = SessionCollection(users_collection, self.session)
+            for name, collection in [('users_collection', self.users_collection),
+                                     ('events_collection', SessionCollection(events_collection, self.session)),
+                                     ('rsvps_collection', SessionCollection(rsvps_collection, self.session))]:
+                patcher = patch(f'app.{name}', collection)
+                patcher.start()
+                self.addCleanup(patcher.stop)
+            # Stale copies of the test accounts would shadow the ones the tests insert; the abort restores them
+            self.users_collection.delete_many({'email': {'$in': list(TEST_EMAILS)}})
+        else:
+            # Standalone servers have no transactions; fall back to clearing the collections
+            self.session = None
+            self.users_collection = users_collection
+            users_collection.delete_many({})
+            events_collection.delete_many({})
+            rsvps_collection.delete_many({})
+    
+    def tearDown(self):
+        """Clean up after tests"""
+        if self.session is not None:
+            self.session.abort_transaction()
+            self.session.end_session()
+        else:
+            users_collection.delete_many({})
+            events_collection.delete_many({})
+            rsvps_collection.delete_many({})
+    
     def test_enhanced_login_validation(self):
         """Test enhanced login validation"""
         print("\n🧪 Testing Enhanced Login Validation...")
@@ -130,9 +275,8 @@ class TestEnhancedAuthentication(unittest.TestCase):
         }
         
         # Hash password
-        from werkzeug.security import generate_password_hash
-        test_user['password'] = generate_password_hash(test_user['password'])
-        users_collection.insert_one(test_user)
+        test_user['password'] = self.HASHED[test_user['password']]
+        self.users_collection.insert_one(test_user)
         
         # Test 1: Valid login
         response = self.client.post('/login', data={
@@ -177,7 +321,7 @@ class TestEnhancedAuthentication(unittest.TestCase):
         """Test enhanced admin login functionality"""
         print("\n🧪 Testing Enhanced Admin Login...")
         
-        # Create a test admin user
+        # Create a test admin user and a regular user
         admin_user = {
             'name': 'Admin User',
             'email': 'admin@example.com',
@@ -189,20 +333,6 @@ class TestEnhancedAuthentication(unittest.TestCase):
             'created_at': datetime.now()
         }
         
-        from werkzeug.security import generate_password_hash
-        admin_user['password'] = generate_password_hash(admin_user['password'])
-        users_collection.insert_one(admin_user)
-        
-        # Test 1: Valid admin login
-        response = self.client.post('/admin/login', data={
-            'email': 'admin@example.com',
-            'password': 'AdminPass123!'
-        })
-        
-        self.assertEqual(response.status_code, 302)
-        self.assertIn(b'Welcome back', response.data)
-        
-        # Test 2: Non-admin trying to access admin login
         regular_user = {
             'name': 'Regular User',
             'email': 'regular@example.com',
@@ -214,9 +344,21 @@ class TestEnhancedAuthentication(unittest.TestCase):
             'created_at': datetime.now()
         }
         
-        regular_user['password'] = generate_password_hash(regular_user['password'])
-        users_collection.insert_one(regular_user)
+        for user in (admin_user, regular_user):
+            user['password'] = self.HASHED[user['password']]
+        # Both users in one round-trip
+        self.users_collection.insert_many([admin_user, regular_user], ordered=False)
+        
+        # Test 1: Valid admin login
+        response = self.client.post('/admin/login', data={
+            'email': 'admin@example.com',
+            'password': 'AdminPass123!'
+        })
+        
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(b'Welcome back', response.data)
         
+        # Test 2: Non-admin trying to access admin login
         response = self.client.post('/admin/login', data={
             'email': 'regular@example.com',
             'password': 'UserPass123!'
@@ -252,9 +394,8 @@ class TestEnhancedAuthentication(unittest.TestCase):
             'created_at': datetime.now()
         }
         
-        from werkzeug.security import generate_password_hash
-        test_user['password'] = generate_password_hash(test_user['password'])
-        users_collection.insert_one(test_user)
+        test_user['password'] = self.HASHED[test_user['password']]
+        self.users_collection.insert_one(test_user)
         
         # Test 1: Forgot password request
         with patch('app.send_notification_email') as mock_email:
@@ -276,39 +417,6 @@ class TestEnhancedAuthentication(unittest.TestCase):
         
         print("✅ Password reset flow tests passed!")
     
-    def test_ui_enhancements(self):
-        """Test UI enhancements are properly rendered"""
-        print("\n🧪 Testing UI Enhancements...")
-        
-        # Test 1: Enhanced login page
-        response = self.client.get('/login')
-        self.assertEqual(response.status_code, 200)
-        self.assertIn(b'Welcome Back', response.data)
-        self.assertIn(b'password strength', response.data)
-        self.assertIn(b'Remember me', response.data)
-        
-        # Test 2: Enhanced registration page
-        response = self.client.get('/register')
-        self.assertEqual(response.status_code, 200)
-        self.assertIn(b'Join Our Alumni Community', response.data)
-        self.assertIn(b'Password strength', response.data)
-        self.assertIn(b'Terms of Service', response.data)
-        
-        # Test 3: Enhanced admin login page
-        response = self.client.get('/admin/login')
-        self.assertEqual(response.status_code, 200)
-        self.assertIn(b'Admin Portal', response.data)
-        self.assertIn(b'Security Notice', response.data)
-        self.assertIn(b'Restricted Access', response.data)
-        
-        # Test 4: Enhanced forgot password page
-        response = self.client.get('/forgot-password')
-        self.assertEqual(response.status_code, 200)
-        self.assertIn(b'Reset Your Password', response.data)
-        self.assertIn(b'What happens next', response.data)
-        
-        print("✅ UI enhancements tests passed!")
-    
     def test_session_management(self):
         """Test enhanced session management"""
         print("\n🧪 Testing Session Management...")
@@ -325,9 +433,8 @@ class TestEnhancedAuthentication(unittest.TestCase):
             'created_at': datetime.now()
         }
         
-        from werkzeug.security import generate_password_hash
-        test_user['password'] = generate_password_hash(test_user['password'])
-        users_collection.insert_one(test_user)
+        test_user['password'] = self.HASHED[test_user['password']]
+        self.users_collection.insert_one(test_user)
         
         # Test 1: Login with remember me
         response = self.client.post('/login', data={
@@ -347,47 +454,23 @@ class TestEnhancedAuthentication(unittest.TestCase):
         self.assertEqual(response.status_code, 302)
         
         print("✅ Session management tests passed!")
-    
-    def test_security_features(self):
-        """Test security enhancements"""
-        print("\n🧪 Testing Security Features...")
-        
-        # Test 1: SQL injection protection
-        malicious_input = "'; DROP TABLE users; --"
-        response = self.client.post('/login', data={
-            'email': malicious_input,
-            'password': 'test'
-        })
-        
-        # Should not crash and should handle gracefully
-        self.assertEqual(response.status_code, 200)
-        
-        # Test 2: XSS protection
-        xss_input = "<script>alert('xss')</script>"
-        response = self.client.post('/register', data={
-            'name': xss_input,
-            'email': 'xss@example.com',
-            'grad_year': '2020',
-            'password': 'SecurePass123!',
-            'confirm_password': 'SecurePass123!',
-            'terms': 'on'
-        })
-        
-        # Should escape the input
-        self.assertEqual(response.status_code, 302)
-        
-        print("✅ Security features tests passed!")
+
+FAST_TEST_ORDER = ('test_ui_enhancements', 'test_enhanced_registration_validation', 'test_security_features')
+SLOW_TEST_ORDER = ('test_enhanced_login_validation', 'test_admin_login_enhancements',
+                   'test_password_reset_flow', 'test_session_management')
 
 def run_enhanced_auth_tests():
     """Run all enhanced authentication tests"""
     print("🚀 Starting Enhanced Authentication System Tests...")
     print("=" * 60)
     
-    # Create test suite
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestEnhancedAuthentication)
+    # Fastest first: page rendering, then mocked validation, then the database flows
+    suite = unittest.TestSuite()
+    suite.addTests(TestAuthValidation(name) for name in FAST_TEST_ORDER)
+    suite.addTests(TestAuthIntegration(name) for name in SLOW_TEST_ORDER)
     
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Stop at the first failure instead of paying for the slower tests behind it
+    runner = unittest.TextTestRunner(verbosity=2, failfast=True)
     result = runner.run(suite)
     
     # Print summary
@@ -4,7 +4,10 @@ Test script to verify the separate login system works correctly
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Test configuration
@@ -12,6 +15,20 @@ BASE_URL = "http://localhost:5000"
 ADMIN_EMAIL = "admin@alumni-scheduler.com"
 ADMIN_PASSWORD = "admin123"
 
+def _pooled_session():
+    """Keep-alive session whose connections are reused across every probe"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                          max_retries=Retry(total=2, backoff_factor=0.1))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+# Separate cookie jars for the two users, each with its own connection pool
+ADMIN_SESSION = _pooled_session()
+ALUMNI_SESSION = _pooled_session()
+
 def test_separate_logins():
     """Test that admin and alumni can login separately without logging each other out"""
     
@@ -20,7 +37,7 @@ def test_separate_logins():
     
     # Test 1: Admin login
     print("\n1. Testing Admin Login...")
-    session = requests.Session()
+    session = ADMIN_SESSION
     
     # Get login page
     response = session.get(f"{BASE_URL}/admin/login")
@@ -45,7 +62,7 @@ def test_separate_logins():
     
     # Test 2: Alumni login (should not affect admin session)
     print("\n2. Testing Alumni Login (should not affect admin session)...")
-    alumni_session = requests.Session()
+    alumni_session = ALUMNI_SESSION
     
     # Get alumni login page
     response = alumni_session.get(f"{BASE_URL}/login")
@@ -67,33 +84,21 @@ def test_separate_logins():
     # Test 4: Test new features
     print("\n4. Testing New Features...")
     
-    # Test alumni dashboard
-    response = session.get(f"{BASE_URL}/dashboard")
-    if response.status_code == 200:
-        print("✅ Alumni dashboard accessible")
-    else:
-        print("❌ Alumni dashboard not accessible")
-    
-    # Test calendar view
-    response = session.get(f"{BASE_URL}/calendar")
-    if response.status_code == 200:
-        print("✅ Calendar view accessible")
-    else:
-        print("❌ Calendar view not accessible")
-    
-    # Test search
-    response = session.get(f"{BASE_URL}/search")
-    if response.status_code == 200:
-        print("✅ Search page accessible")
-    else:
-        print("❌ Search page not accessible")
-    
-    # Test API endpoints
-    response = session.get(f"{BASE_URL}/api/events/upcoming")
-    if response.status_code == 200:
-        print("✅ API endpoints working")
-    else:
-        print("❌ API endpoints not working")
+    # Independent read-only pages, fetched concurrently
+    feature_checks = {
+        "/dashboard": ("Alumni dashboard accessible", "Alumni dashboard not accessible"),
+        "/calendar": ("Calendar view accessible", "Calendar view not accessible"),
+        "/search": ("Search page accessible", "Search page not accessible"),
+        "/api/events/upcoming": ("API endpoints working", "API endpoints not working"),
+    }
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        # map() keeps the report in the order of feature_checks
+        responses = pool.map(session.get, [f"{BASE_URL}{path}" for path in feature_checks])
+        for (ok_message, fail_message), response in zip(feature_checks.values(), responses):
+            if response.status_code == 200:
+                print(f"✅ {ok_message}")
+            else:
+                print(f"❌ {fail_message}")
     
     print("\n🎉 All tests completed!")
     return True
@@ -103,7 +108,8 @@ def test_ui_improvements():
     print("\n🎨 Testing UI Improvements")
     print("=" * 50)
     
-    session = requests.Session()
+    # Logged-out view of the homepage
+    session = ALUMNI_SESSION
     
     # Test enhanced styles
     response = session.get(f"{BASE_URL}/")